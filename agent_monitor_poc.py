@@ -13,6 +13,15 @@ Advanced architecture with:
 
 Dependencies:
     pip install pyautogui pync pytesseract Pillow simpleaudio numpy
+
+Optional:
+    pip install tesserocr   # In-process Tesseract API (no subprocess per OCR call)
+    pip install easyocr     # GPU OCR backend (OCR_BACKEND = "easyocr")
+    pip install pyobjc-framework-Vision   # Apple Vision OCR (OCR_BACKEND = "vision")
+    pip install mss         # Raw BGRA screen capture (pyautogui.screenshot otherwise)
+    pip install xxhash      # Faster frame digests for the screen-change gate (zlib.crc32 otherwise)
+    pip install numba       # JIT NCC kernel for the full-scale confirm step (fast_ncc.py)
+    pip install pyobjc-framework-libdispatch   # GCD timer scheduling (WATCHER_SCHEDULER = "dispatch")
 """
 
 import pyautogui
@@ -21,22 +30,54 @@ import threading
 from pync import Notifier
 from datetime import datetime
 from typing import Optional, Protocol
-from PIL import ImageGrab, Image
+from PIL import Image
 import pytesseract
+try:
+    import tesserocr  # Optional: keeps the Tesseract engine resident in-process
+except ImportError:
+    tesserocr = None
+try:
+    import mss  # Optional: raw BGRA screen capture without PIL/PNG conversion
+except ImportError:
+    mss = None
+try:
+    import xxhash  # Optional: SIMD frame digests for the screen-change gate
+except ImportError:
+    xxhash = None
+try:
+    import dispatch  # Optional: pyobjc-framework-libdispatch, GCD timer for the watcher
+except ImportError:
+    dispatch = None
+try:
+    import fast_ncc  # Optional (needs numba): JIT NCC for the pyramid confirm step
+except ImportError:
+    fast_ncc = None
 import queue
+import atexit
+import weakref
+import collections
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 # import simpleaudio as sa  # Removed: replaced with NSSound for thread safety
 import os
+import zlib
 import cv2
 import numpy as np
 import platform
+import ctypes
 from enum import Enum, auto
 import logging
+import logging.handlers
 import AppKit
+import Quartz
 import objc
 from Foundation import NSObject, NSMakeRect, NSMakePoint, NSLayoutConstraint
 import signal
 import sys
 
+logger = logging.getLogger(__name__)
+
 ########################################################
 # === Thread-Safe GUI Operations ===
 ########################################################
@@ -46,6 +87,8 @@ class NotificationQueue:
     
     def __init__(self):
         self._queue = queue.Queue()
+        # pync runs terminal-notifier as a subprocess and waits for it - keep that off the main thread
+        self._sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notifier")
     
     def put_notification(self, message: str, title: str = "Agent Monitor"):
         """Queue a notification to be processed by main thread."""
@@ -54,16 +97,20 @@ class NotificationQueue:
         except queue.Full:
             print(f"[WARNING] Notification queue full, dropping: {title}: {message}")
     
+    @staticmethod
+    def _send(notification):
+        try:
+            Notifier.notify(notification["message"], title=notification["title"])
+        except Exception:
+            logger.error("Notification failed", exc_info=True)
+
     def process_notifications(self):
-        """Process all queued notifications. Must be called from main thread."""
+        """Hand queued notifications to the sender thread. Called from the main thread timer."""
         notifications_processed = 0
         while not self._queue.empty() and notifications_processed < 10:  # Limit processing per cycle
             try:
                 notification = self._queue.get_nowait()
-                try:
-                    Notifier.notify(notification["message"], title=notification["title"])
-                except Exception as e:
-                    print(f"[ERROR] Notification failed: {e}")
+                self._sender.submit(self._send, notification)  # Fire and forget, in order
                 notifications_processed += 1
             except queue.Empty:
                 break
@@ -88,8 +135,26 @@ class ThreadSafeSoundPlayer:
     """Thread-safe sound player using macOS native NSSound APIs."""
     
     def __init__(self):
-        self._cache = {}
+        self._cache = {}  # sound_type -> NSSound, loaded once at startup
+        self._last_played = {}  # sound_type -> time.monotonic() of last playback
         self._lock = threading.Lock()
+        self._preload_sounds()
+        
+    def _preload_sounds(self):
+        """Load every alert sound once so play_sound never touches the filesystem."""
+        for sound_type, file_name in ALERT_SOUNDS.items():
+            sound_path = os.path.join(AUDIO_DIR, file_name)
+            if not os.path.exists(sound_path):
+                print(f"[WARNING] Sound file not found: {sound_path}")
+                continue
+            # Read the bytes now and decode from memory; byReference=True would defer file I/O
+            # to the first play() on the monitor thread
+            sound_data = AppKit.NSData.dataWithContentsOfFile_(sound_path)
+            ns_sound = AppKit.NSSound.alloc().initWithData_(sound_data) if sound_data else None
+            if ns_sound:
+                self._cache[sound_type] = ns_sound
+            else:
+                print(f"[ERROR] Failed to load sound file: {sound_path}")
         
     def play_sound(self, sound_type: str):
         """Play sound with thread safety using NSSound (native macOS)."""
@@ -98,30 +163,20 @@ class ThreadSafeSoundPlayer:
             print(f"[AUDIO DISABLED] Skipping sound: {sound_type}")
             return
             
-        if sound_type not in ALERT_SOUNDS:
-            return
-            
-        sound_path = os.path.join(AUDIO_DIR, ALERT_SOUNDS[sound_type])
-        if not os.path.exists(sound_path):
-            print(f"[WARNING] Sound file not found: {sound_path}")
+        sound = self._cache.get(sound_type)
+        if sound is None:
             return
             
         try:
             with self._lock:
-                # Cache NSSound objects if not already cached
-                if sound_path not in self._cache:
-                    ns_sound = AppKit.NSSound.alloc().initWithContentsOfFile_byReference_(sound_path, True)
-                    if ns_sound:
-                        self._cache[sound_path] = ns_sound
-                    else:
-                        print(f"[ERROR] Failed to load sound file: {sound_path}")
-                        return
+                # Don't stack overlapping playbacks when a state persists across ticks
+                now = time.monotonic()
+                if now - self._last_played.get(sound_type, float("-inf")) < MIN_SOUND_REPLAY_INTERVAL:
+                    return
+                self._last_played[sound_type] = now
                 
-                # Play the cached sound
-                sound = self._cache[sound_path]
-                if sound:
-                    # NSSound.play() is thread-safe and non-blocking
-                    sound.play()
+                # NSSound.play() is thread-safe and non-blocking
+                sound.play()
                     
         except Exception as e:
             print(f"[ERROR] Failed to play sound '{sound_type}': {e}")
@@ -145,14 +200,75 @@ MIN_CONFIDENCE_GAP = 0.08          # Lowered from 0.12 to handle closer matches
 REQUIRED_CONFIRMATIONS = 2         # Require 2 consistent detections for stability
 MIN_STATE_CHANGE_INTERVAL = 5      # Minimum seconds between state changes (increased for stability)
 
+# Match on single-channel grayscale (1/3 the correlation work of BGR). Set False to match in color.
+GRAYSCALE_MATCHING = True
+
+# Run matchTemplate through OpenCV's OpenCL T-API (cv2.UMat) when an OpenCL device is available.
+# "auto" enables it on Intel Macs only (Apple Silicon's deprecated OpenCL layer is rarely faster than
+# the NEON CPU path); True forces it on any machine with OpenCL, False keeps matching on the CPU.
+USE_OPENCL = "auto"
+
+# Coarse-to-fine search: match a downscaled frame first and confirm at full scale only around
+# promising peaks. Cuts the common no-match tick to roughly PYRAMID_SCALE**2 of the work.
+PYRAMID_MATCHING = True
+PYRAMID_SCALE = 0.25               # Coarse pass scale factor
+PYRAMID_COARSE_THRESHOLD = 0.6     # Coarse TM_CCOEFF_NORMED score needed before the full-scale confirm
+PYRAMID_ROI_PAD = 16               # Extra full-scale pixels around the coarse peak (absorbs rounding)
+PYRAMID_MIN_TEMPLATE_SIZE = 8      # Templates smaller than this once downscaled are matched at full scale
+USE_NUMBA_CONFIRM = True           # Score the confirm ROI with fast_ncc (grayscale only, needs numba)
+# The coarse pass only has to reject non-matches, so it can use TM_SQDIFF_NORMED (no per-position
+# mean subtraction). The full-scale confirm always uses TM_CCOEFF_NORMED, so reported confidences
+# keep their meaning. With SQDIFF, the confirm runs when the coarse score is <= PYRAMID_COARSE_MAX_SQDIFF.
+PYRAMID_COARSE_SQDIFF = True
+PYRAMID_COARSE_MAX_SQDIFF = 0.2
+
+# After a confident match, search only this many pixels around it on later ticks (full frame on a miss)
+ROI_SEARCH_PAD = 200
+# A template scoring at least this is taken as certain - the state's remaining templates are skipped
+EARLY_EXIT_CONFIDENCE = 0.95
+
+# Per-state match results kept for this many recently seen frames (keyed by an exact pixel digest),
+# so a screen flipping back to a known look skips matching entirely
+MATCH_CACHE_SIZE = 32
+
 # Legacy support - you can switch back to simple detector by setting this to True
 USE_LEGACY_DETECTOR = False
 
 CHECK_INTERVAL_SEC = 2
+MAX_CHECK_INTERVAL_SEC = 10        # Upper bound for the poll interval while the screen is static
+CHECK_INTERVAL_BACKOFF = 1.5       # Interval multiplier per unchanged frame
+# "thread": Python worker thread waiting on an Event. "dispatch": GCD timer source on a utility-QoS
+# queue (needs pyobjc-framework-libdispatch; falls back to "thread").
+WATCHER_SCHEDULER = "thread"
+WATCHER_TIMER_LEEWAY = 0.1         # Fraction of the interval the kernel may shift a GCD tick to coalesce wakeups
 TELEMETRY_FILE = "telemetry.json"
+TELEMETRY_QUEUE_SIZE = 1024        # Max telemetry events waiting for the background writer
+TELEMETRY_BATCH_SIZE = 64          # Max events written per SQLite transaction
+TELEMETRY_STATS_CACHE_SEC = 60     # Reuse the startup stats query for adapters created within this window
+LOG_FILE = "agent_monitor.log"
+LOG_QUEUE_SIZE = 1024              # Records waiting for the log writer thread; extras are dropped during error storms
 AUTO_CLICK_ENABLED = False
 OCR_ENABLED = True
+OCR_BACKEND = "tesseract"  # "tesseract", "easyocr" (GPU via MPS/CUDA) or "vision" (Apple Vision); falls back to tesseract
+# Tesseract tuning - we only look for a few English keywords, so restrict the search space
+OCR_PAGE_SEG_MODE = 6  # --psm: 6 = single text block (window capture), 7 = single line (status crop)
+OCR_CHAR_WHITELIST = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+OCR_FOCUS_PAD = (100, 200, 100, 50)  # left, top, right, bottom pixels around the last template match to OCR
+OCR_STATE_TTL_SEC = 30  # Reuse the last OCR result for an unchanged frame for up to this long
+# Run detectors as fallbacks: later ones (OCR) only when every earlier one returned UNKNOWN.
+# A fallback's answer is used only if it is a real state - OCR reports UNKNOWN unless a keyword matched.
+# False runs them all concurrently each tick - lower worst-case latency, but pays for OCR every tick.
+TIERED_DETECTORS = True
 COMMAND_QUEUE_ENABLED = True
+
+# Screen region handed to OCR - (x, y, width, height) in screen points.
+# Leave as None to resolve it once at startup from the Cursor window bounds.
+CURSOR_APP_NAME = "Cursor"
+CURSOR_REGION = None
+# Template matching captures only the Cursor window (re-located every WINDOW_BOUNDS_REFRESH_SEC)
+# instead of the whole display; falls back to the full display while the window isn't found.
+CAPTURE_CURSOR_WINDOW = True
+WINDOW_BOUNDS_REFRESH_SEC = 5
 DIAGNOSTIC_MODE = True
 AUDIO_ENABLED = True  # Re-enabled with thread-safe implementation
 
@@ -168,6 +284,10 @@ DIAGNOSTIC_VERBOSITY = "high"     # Recommended: "low" for clean output
 CLEAR_CONSOLE_ON_UPDATE = False  # Clear console before each update (can be jarring)
 SHOW_CONFIDENCE_DETAILS = True   # Show detailed confidence scores
 USE_COMPACT_OUTPUT = True        # Use single-line status updates (recommended)
+DIAGNOSTIC_HISTORY_SIZE = 256    # Per-state match confidences kept in memory for the control panel
+SPARKLINE_LENGTH = 8             # Recent confidences shown next to the confidence label
+ALPHA_APPLY_INTERVAL_SEC = 1 / 60  # Minimum gap between window re-tints while the alpha slider is dragged
+DEBUG_VIEW_MAX_WIDTH = 1280      # Debug frames are downscaled to at most this many pixels wide before drawing
 
 # === Agent States ===
 class AgentState:
@@ -177,6 +297,14 @@ class AgentState:
     COMMAND_RUNNING = "command_running"
     UNKNOWN = "unknown"
 
+# Control panel text per state
+STATE_LABELS = {
+    AgentState.IDLE: "💤 idle",
+    AgentState.ACTIVE: "🚀 active",
+    AgentState.RUN_COMMAND: "⚡ run_command",
+    AgentState.COMMAND_RUNNING: "🔄 command_running",
+}
+
 # State mapping - 1:1 mapping of directories to states
 STATE_TEMPLATE_MAPPING = {
     AgentState.IDLE: ["agent_idle"],
@@ -202,12 +330,20 @@ ALERT_SOUNDS = {
 IDLE_ALERT_REPEAT_INTERVAL = 60  # Repeat idle alert every 60 seconds
 RUN_COMMAND_ALERT_REPEAT_INTERVAL = 60  # Repeat run_command alert every 60 seconds
 COMMAND_RUNNING_ALERT_REPEAT_INTERVAL = 60  # Repeat command_running alert every 60 seconds
+MIN_SOUND_REPLAY_INTERVAL = 1.0  # Ignore repeat requests for the same sound within this many seconds
 
 # === Enhanced Telemetry with DI ===
 from container import initialize_telemetry_system
 from telemetry import EventType, TelemetryService
 
 # === Enhanced Console Output Utilities ===
+SPARKLINE_BARS = "▁▂▃▄▅▆▇█"
+
+def confidence_sparkline(values) -> str:
+    """Render 0..1 confidences as a compact unicode bar chart."""
+    top = len(SPARKLINE_BARS) - 1
+    return "".join(SPARKLINE_BARS[min(max(int(v * top + 0.5), 0), top)] for v in values)
+
 class DiagnosticOutput:
     """Utility class for better formatted diagnostic output."""
     
@@ -309,7 +445,15 @@ class DiagnosticOutput:
 diagnostic_output = DiagnosticOutput()
 
 class LegacyTelemetryAdapter:
-    """Adapter to maintain compatibility with existing code while using new telemetry system."""
+    """Adapter to maintain compatibility with existing code while using new telemetry system.
+
+    record_* calls update the in-memory counters immediately and hand the event to a background
+    writer thread, so SQLite I/O never runs on the detection tick.
+    """
+    
+    # Last _sync_stats result per repository (the service is a per-call factory product, the
+    # repository a singleton): repository -> (time.monotonic(), SessionStats)
+    _stats_cache = weakref.WeakKeyDictionary()
     
     def __init__(self, telemetry_service: TelemetryService):
         self.telemetry_service = telemetry_service
@@ -319,11 +463,22 @@ class LegacyTelemetryAdapter:
         
         # Initialize stats from database
         self._sync_stats()
+        
+        # Bounded so a stalled database can't grow memory without limit; events are dropped when full
+        self._queue = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(target=self._writer, name="telemetry-writer", daemon=True)
+        self._writer_thread.start()
     
     def _sync_stats(self):
-        """Sync stats with database."""
+        """Seed the counters from the database once; afterwards they are maintained in memory."""
         try:
-            stats = self.telemetry_service.get_recent_stats(hours=24)
+            source = getattr(self.telemetry_service, 'repository', self.telemetry_service)
+            cache = LegacyTelemetryAdapter._stats_cache.get(source)
+            if cache is not None and time.monotonic() - cache[0] < TELEMETRY_STATS_CACHE_SEC:
+                stats = cache[1]
+            else:
+                stats = self.telemetry_service.get_recent_stats(hours=24, lightweight=True)
+                LegacyTelemetryAdapter._stats_cache[source] = (time.monotonic(), stats)
             self.idle_detections = stats.total_idle_detections
             self.detection_failures = stats.total_detection_failures
             if stats.last_event:
@@ -331,9 +486,46 @@ class LegacyTelemetryAdapter:
         except:
             pass  # Use defaults if database isn't available
     
+    def _enqueue(self, **record):
+        """Queue a record_detection() call for the writer thread."""
+        record["timestamp"] = datetime.now()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            print(f"[WARNING] Telemetry queue full, dropping event: {record.get('message')}")
+    
+    def _writer(self):
+        """Drain queued events and write them in batches of up to TELEMETRY_BATCH_SIZE."""
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            batch = [record]
+            stop = False
+            while len(batch) < TELEMETRY_BATCH_SIZE:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            try:
+                self.telemetry_service.record_detections(batch)
+            except Exception as e:
+                print(f"[ERROR] Failed to write {len(batch)} telemetry events: {e}")
+            if stop:
+                return
+    
+    def close(self, timeout: float = 5.0):
+        """Flush queued events and stop the writer thread."""
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
+    
     def log_event(self, msg: str):
         """Log a generic info event."""
-        self.telemetry_service.record_detection(
+        self._enqueue(
             event_type=EventType.INFO,
             message=msg
         )
@@ -343,7 +535,7 @@ class LegacyTelemetryAdapter:
         self.idle_detections += 1
         self.last_idle_detection = time.time()
         
-        self.telemetry_service.record_detection(
+        self._enqueue(
             event_type=EventType.IDLE_DETECTION,
             message="Agent idle state detected",
             confidence=confidence,
@@ -354,7 +546,7 @@ class LegacyTelemetryAdapter:
 
     def record_active_detection(self, confidence: float = None, detection_method: str = None, match_rect: tuple = None):
         """Record an active detection."""
-        self.telemetry_service.record_detection(
+        self._enqueue(
             event_type=EventType.ACTIVE_DETECTION,
             message="Agent active state detected",
             confidence=confidence,
@@ -367,7 +559,7 @@ class LegacyTelemetryAdapter:
         """Record a detection failure."""
         self.detection_failures += 1
         
-        self.telemetry_service.record_detection(
+        self._enqueue(
             event_type=EventType.DETECTION_FAILURE,
             message=error_message or "Failed to detect agent state",
             state="unknown"
@@ -410,12 +602,230 @@ def load_templates_from_directories(template_dirs: dict, state_mapping: dict):
     
     return state_templates
 
+# === Screen Capture Utilities ===
+def find_cursor_window(app_name: str = CURSOR_APP_NAME):
+    """Return (window_id, (x, y, width, height)) of the largest on-screen window owned by app_name.
+
+    Returns (None, None) when no matching window is found.
+    """
+    try:
+        window_list = Quartz.CGWindowListCopyWindowInfo(
+            Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+            Quartz.kCGNullWindowID
+        )
+    except Exception as e:
+        print(f"[WARNING] Could not enumerate windows: {e}")
+        return None, None
+
+    best_window_id = None
+    best_bounds = None
+    best_area = 0
+    for window in window_list or []:
+        # Layer 0 is the normal window layer - skips menu bar extras and overlays
+        if window.get(Quartz.kCGWindowOwnerName) != app_name or window.get(Quartz.kCGWindowLayer, 0) != 0:
+            continue
+        bounds = window.get(Quartz.kCGWindowBounds)
+        if not bounds:
+            continue
+        width, height = int(bounds["Width"]), int(bounds["Height"])
+        if width * height > best_area:
+            best_area = width * height
+            best_window_id = int(window[Quartz.kCGWindowNumber])
+            best_bounds = (int(bounds["X"]), int(bounds["Y"]), width, height)
+
+    return best_window_id, best_bounds
+
+def cgimage_to_array(cg_image):
+    """Wrap a CGImage's pixel data as an (h, w, 4) BGRA uint8 array - no PNG encode or temp file."""
+    width = Quartz.CGImageGetWidth(cg_image)
+    height = Quartz.CGImageGetHeight(cg_image)
+    bytes_per_row = Quartz.CGImageGetBytesPerRow(cg_image)
+    data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(cg_image))
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(height, bytes_per_row)
+    # Rows may be padded for alignment - drop the padding bytes
+    return rows[:, :width * 4].reshape(height, width, 4)
+
+def capture_cg_image(window_id=None, region=None):
+    """Capture a window, a screen region or the whole display in-process as a CGImage.
+
+    Returns None if the capture failed (e.g. the window was closed).
+    """
+    if window_id is not None:
+        return Quartz.CGWindowListCreateImage(
+            Quartz.CGRectNull,
+            Quartz.kCGWindowListOptionIncludingWindow,
+            window_id,
+            Quartz.kCGWindowImageBoundsIgnoreFraming
+        )
+    rect = Quartz.CGRectMake(*region) if region else Quartz.CGRectInfinite
+    return Quartz.CGWindowListCreateImage(
+        rect,
+        Quartz.kCGWindowListOptionOnScreenOnly,
+        Quartz.kCGNullWindowID,
+        Quartz.kCGWindowImageDefault
+    )
+
+def main_display_scale() -> float:
+    """Pixels per point on the main display (2.0 on Retina)."""
+    mode = Quartz.CGDisplayCopyDisplayMode(Quartz.CGMainDisplayID())
+    return Quartz.CGDisplayModeGetPixelWidth(mode) / Quartz.CGDisplayModeGetWidth(mode)
+
+def capture_screen(window_id=None, region=None):
+    """Capture via CoreGraphics and return a BGRA numpy array, or None on failure."""
+    cg_image = capture_cg_image(window_id, region)
+    if cg_image is None:
+        return None
+    return cgimage_to_array(cg_image)
+
+class FrameGrabber:
+    """Captures the monitored display (or just the Cursor window) once per tick as a BGRA numpy array.
+
+    Uses mss (raw BGRA buffer, no PNG encode) when installed and falls back to pyautogui,
+    which always captures the full display.
+    """
+
+    def __init__(self, region: Optional[dict] = None, track_window: bool = False):
+        self._configured_region = region  # mss-style {"left", "top", "width", "height"}
+        self._region = region
+        # Follow the Cursor window's bounds instead of a fixed region
+        self._track_window = track_window and region is None
+        self._region_time = 0.0
+        self._scale = None
+        self._sct = None
+        self.origin = (0, 0)  # Top-left of the last grabbed frame, in screen points
+
+    def invalidate(self):
+        """Forget the cached display bounds - call when the screen configuration changes."""
+        self._region = self._configured_region
+
+    def _resolve_region(self):
+        if self._track_window:
+            _, bounds = find_cursor_window()
+            if bounds is not None:
+                x, y, width, height = bounds
+                return {"left": x, "top": y, "width": width, "height": height}
+        # Primary monitor bounds
+        return dict(self._sct.monitors[1])
+
+    def to_display_rect(self, rect):
+        """Map an (x, y, w, h) rect in frame pixels to display pixels, or pass None through."""
+        if rect is None:
+            return None
+        if self._scale is None:
+            self._scale = main_display_scale()
+        x, y, width, height = rect
+        return (x + self.origin[0] * self._scale, y + self.origin[1] * self._scale, width, height)
+
+    def grab(self):
+        if mss is None:
+            screenshot = np.asarray(pyautogui.screenshot())
+            code = cv2.COLOR_RGBA2BGRA if screenshot.shape[2] == 4 else cv2.COLOR_RGB2BGRA
+            return cv2.cvtColor(screenshot, code)
+        
+        if self._sct is None:
+            self._sct = mss.mss()
+        now = time.monotonic()
+        if self._region is None or (self._track_window and now - self._region_time > WINDOW_BOUNDS_REFRESH_SEC):
+            # Resolved once and reused until invalidate(); a tracked window is re-located periodically
+            self._region = self._resolve_region()
+            self._region_time = now
+        shot = self._sct.grab(self._region)
+        self.origin = (self._region["left"], self._region["top"])
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+# === Input Injection ===
+KEYCODE_RETURN = 36  # kVK_Return
+
+def post_key_press(keycode: int):
+    """Post a key down/up pair straight to the HID event tap via Quartz."""
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, keycode, key_down)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+def post_text(text: str):
+    """Type text as unicode keyboard events - no per-character keyboard-map lookup."""
+    for char in text:
+        utf16_length = len(char.encode("utf-16-le")) // 2
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+            Quartz.CGEventKeyboardSetUnicodeString(event, utf16_length, char)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+def frame_digest(frame) -> int:
+    """Cheap 64-bit (xxh3) or 32-bit (crc32) digest of a frame's pixels."""
+    buf = np.ascontiguousarray(frame)
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(buf)
+    return zlib.crc32(buf)
+
+# === Thread Scheduling ===
+QOS_CLASS_UTILITY = 0x11  # qos_class_t from <sys/qos.h>
+
+def set_thread_qos(qos_class: int = QOS_CLASS_UTILITY):
+    """Tag the calling thread with a macOS QoS class so background scanning yields to the UI thread."""
+    try:
+        libpthread = ctypes.CDLL("/usr/lib/system/libsystem_pthread.dylib")
+        libpthread.pthread_set_qos_class_self_np(qos_class, 0)
+    except (OSError, AttributeError) as e:
+        print(f"[WARNING] Could not set thread QoS class: {e}")
+
 # === Detection Engine Interface ===
 class StateDetector(Protocol):
-    def detect_state(self) -> str:
+    def detect_state(self, frame=None, digest=None) -> str:
+        """Detect the agent state from a BGRA frame (or capture one when frame is None).
+
+        digest, if given, is the caller's frame_digest() of frame and may be used to skip rehashing it.
+        """
         ...
 
 # === Enhanced Multi-Template Detection Engine ===
+class SharedWindowStats:
+    """Integral images of one grayscale frame, shared by every template correlated against it.
+
+    TM_CCOEFF_NORMED = sum(I * T') / (||I - mean(I)|| * ||T'||) with T' the mean-centered template.
+    The window term ||I - mean(I)|| depends only on the frame and the template size, so it is
+    computed once per size per frame instead of once per matchTemplate call.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame.astype(np.float32)
+        self.sums, self.sqsums = cv2.integral2(frame, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        self._window_norms = {}  # (h, w) -> map of sqrt(sum(x^2) - sum(x)^2 / n) per offset
+        self._window_sqsums = {}  # (h, w) -> map of sum(x^2) per offset
+
+    def window_sqsum(self, h, w):
+        key = (h, w)
+        if key not in self._window_sqsums:
+            sq = self.sqsums
+            self._window_sqsums[key] = (sq[h:, w:] - sq[:-h, w:] - sq[h:, :-w] + sq[:-h, :-w]).astype(np.float32)
+        return self._window_sqsums[key]
+
+    def window_norm(self, h, w):
+        key = (h, w)
+        if key not in self._window_norms:
+            s, sq = self.sums, self.sqsums
+            window_sum = s[h:, w:] - s[:-h, w:] - s[h:, :-w] + s[:-h, :-w]
+            window_sqsum = sq[h:, w:] - sq[:-h, w:] - sq[h:, :-w] + sq[:-h, :-w]
+            variance = np.maximum(window_sqsum - window_sum * window_sum / (h * w), 0.0)
+            self._window_norms[key] = np.sqrt(variance).astype(np.float32)
+        return self._window_norms[key]
+
+    def ccoeff_normed(self, centered_template, template_norm):
+        """TM_CCOEFF_NORMED score map for a float32 mean-centered template."""
+        h, w = centered_template.shape
+        corr = cv2.matchTemplate(self.frame, centered_template, cv2.TM_CCORR)
+        denom = self.window_norm(h, w) * template_norm
+        return np.divide(corr, denom, out=np.zeros_like(corr), where=denom > 1e-6)
+
+    def sqdiff_normed(self, template, template_sqsum):
+        """TM_SQDIFF_NORMED score map for a float32 template: (sum(I^2) - 2 sum(I*T) + sum(T^2)) / sqrt(sum(I^2) sum(T^2))."""
+        h, w = template.shape
+        window_sq = self.window_sqsum(h, w)
+        corr = cv2.matchTemplate(self.frame, template, cv2.TM_CCORR)
+        denom = np.sqrt(window_sq * template_sqsum)
+        # All-black windows have no defined score - treat them as a non-match
+        return np.divide(window_sq - 2 * corr + template_sqsum, denom, out=np.ones_like(corr), where=denom > 1e-6)
+
 class EnhancedTemplateMatchDetector:
     def __init__(self, state_templates: dict, confidence_threshold=0.8, min_confidence_gap=0.1):
         self.state_templates = state_templates
@@ -424,13 +834,35 @@ class EnhancedTemplateMatchDetector:
         self.last_confidence = None
         self.state_confidences = {}  # Store confidence for each state
         self._last_match_rect = None
-        self._detection_history = []  # For state stability
+        self._detection_history = collections.deque()  # (time, state) for state stability, oldest first
+        # (time, state, confidence, template) per state per tick - read by the control panel
+        # instead of printing every match to stdout
+        self._recent_conf = collections.deque(maxlen=DIAGNOSTIC_HISTORY_SIZE)
         self._last_state_change = 0
         self._min_state_change_interval = MIN_STATE_CHANGE_INTERVAL
         self._required_confirmations = REQUIRED_CONFIRMATIONS
+        self._frame_buf = None  # Reused match-frame conversion buffer, (re)sized on first frame
+        self._small_buf = None  # Reused PYRAMID_SCALE copy of the match frame
+        self._result_bufs = {}  # (template_path, level) -> float32 matchTemplate result map, reused per tick
+        self._use_umat = bool(USE_OPENCL) and cv2.ocl.haveOpenCL()
+        if USE_OPENCL == "auto":
+            self._use_umat = self._use_umat and platform.machine() == "x86_64"
+        if self._use_umat:
+            cv2.ocl.setUseOpenCL(True)
+            print("[INFO] Template matching via OpenCL (cv2.UMat)")
         
         # Load all template images by state
         self.loaded_templates = {}
+        self._template_umats = {}  # template_path -> device-resident copy, uploaded once
+        self._template_pyramids = {}  # template_path -> downscaled copy for the coarse pass
+        self._template_pyramid_umats = {}  # template_path -> device-resident downscaled copy
+        self._template_pyramid_centered = {}  # template_path -> (mean-centered float32 level, norm)
+        self._template_pyramid_f32 = {}  # template_path -> (float32 level, sum of squares) for SQDIFF
+        self._template_ncc = {}  # template_path -> (mean-centered template, norm) for fast_ncc
+        self._state_rois = {}  # state -> (x, y, w, h) of its last confident match
+        self._match_cache = collections.OrderedDict()  # (shape, frame digest) -> state_results, LRU order
+        self._template_hits = collections.Counter()  # template_path -> confident matches, orders the search
+        self._template_names = {}  # template_path -> basename, reported as the matching template
         
         for state, template_paths in state_templates.items():
             self.loaded_templates[state] = []
@@ -438,9 +870,27 @@ class EnhancedTemplateMatchDetector:
                 if not os.path.exists(template_path):
                     print(f"[WARNING] Template not found: {template_path}")
                     continue
-                img = cv2.imread(template_path)
+                img = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE if GRAYSCALE_MATCHING else cv2.IMREAD_COLOR)
                 if img is not None:
                     self.loaded_templates[state].append((template_path, img))
+                    self._template_names[template_path] = os.path.basename(template_path)
+                    if self._use_umat:
+                        self._template_umats[template_path] = cv2.UMat(img)
+                    if PYRAMID_MATCHING and min(img.shape[:2]) * PYRAMID_SCALE >= PYRAMID_MIN_TEMPLATE_SIZE:
+                        self._template_pyramids[template_path] = cv2.resize(
+                            img, None, fx=PYRAMID_SCALE, fy=PYRAMID_SCALE, interpolation=cv2.INTER_AREA
+                        )
+                        if self._use_umat:
+                            self._template_pyramid_umats[template_path] = cv2.UMat(self._template_pyramids[template_path])
+                        elif img.ndim == 2 and PYRAMID_COARSE_SQDIFF:
+                            level = self._template_pyramids[template_path].astype(np.float32)
+                            self._template_pyramid_f32[template_path] = (level, float((level * level).sum()))
+                        elif img.ndim == 2:
+                            centered = self._template_pyramids[template_path].astype(np.float32)
+                            centered -= centered.mean()
+                            self._template_pyramid_centered[template_path] = (centered, float(np.linalg.norm(centered)))
+                        if USE_NUMBA_CONFIRM and fast_ncc is not None and img.ndim == 2:
+                            self._template_ncc[template_path] = fast_ncc.prepare_template(img)
                     print(f"[INFO] Loaded {state} template: {template_path} ({img.shape})")
                 else:
                     print(f"[ERROR] Failed to load template: {template_path}")
@@ -449,38 +899,226 @@ class EnhancedTemplateMatchDetector:
         if not self.loaded_templates.get(AgentState.IDLE) or not self.loaded_templates.get(AgentState.ACTIVE):
             raise RuntimeError("Failed to load template images for required states (idle and active)")
 
-    def _match_templates(self, img, template_list, state_name):
-        """Match multiple templates and return the best match."""
+    def _prepare_frame(self, screenshot):
+        """Convert a screenshot into the reusable match-frame buffer (grayscale or BGR).
+
+        Accepts a BGR(A) or already-grayscale numpy frame from FrameGrabber, or an RGB(A) PIL image.
+        """
+        # np.asarray shares PIL's buffer instead of copying it like np.array
+        is_pil = isinstance(screenshot, Image.Image)
+        img_array = np.asarray(screenshot)
+        if img_array.ndim == 2:
+            if GRAYSCALE_MATCHING:
+                return img_array  # Pre-grayed by the caller, nothing to convert
+            img_array = img_array[:, :, np.newaxis]
+            if self._frame_buf is None or self._frame_buf.shape != img_array.shape[:2] + (3,):
+                self._frame_buf = np.empty(img_array.shape[:2] + (3,), dtype=np.uint8)
+            cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR, dst=self._frame_buf)
+            return self._frame_buf
+        has_alpha = img_array.shape[2] == 4
+        
+        height, width = img_array.shape[:2]
+        if GRAYSCALE_MATCHING:
+            if is_pil:
+                code = cv2.COLOR_RGBA2GRAY if has_alpha else cv2.COLOR_RGB2GRAY
+            else:
+                code = cv2.COLOR_BGRA2GRAY if has_alpha else cv2.COLOR_BGR2GRAY
+            shape = (height, width)
+        else:
+            if is_pil:
+                code = cv2.COLOR_RGBA2BGR if has_alpha else cv2.COLOR_RGB2BGR
+            else:
+                code = cv2.COLOR_BGRA2BGR if has_alpha else None
+            shape = (height, width, 3)
+        
+        if code is None:
+            return img_array  # Already BGR
+        
+        if self._frame_buf is None or self._frame_buf.shape != shape:
+            self._frame_buf = np.empty(shape, dtype=np.uint8)
+        
+        cv2.cvtColor(img_array, code, dst=self._frame_buf)
+        return self._frame_buf
+
+    def _match_into(self, key, image, template, method):
+        """cv2.matchTemplate into a result buffer reused across ticks (host arrays only).
+
+        The buffer is reallocated only when the frame size changes, e.g. on a display reconfigure.
+        """
+        shape = (image.shape[0] - template.shape[0] + 1, image.shape[1] - template.shape[1] + 1)
+        buf = self._result_bufs.get(key)
+        if buf is None or buf.shape != shape:
+            buf = self._result_bufs[key] = np.empty(shape, dtype=np.float32)
+        return cv2.matchTemplate(image, template, method, result=buf)
+
+    def _downscale_frame(self, frame):
+        """Resize the match frame to PYRAMID_SCALE into a buffer reused across ticks."""
+        height, width = frame.shape[:2]
+        size = (max(int(round(width * PYRAMID_SCALE)), 1), max(int(round(height * PYRAMID_SCALE)), 1))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        if self._small_buf is None or self._small_buf.shape != shape:
+            self._small_buf = np.empty(shape, dtype=np.uint8)
+        cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        return self._small_buf
+
+    def _coarse_scores(self, small_frame, template_path):
+        """Coarse score map (TM_SQDIFF_NORMED or TM_CCOEFF_NORMED) of one template's pyramid level."""
+        method = cv2.TM_SQDIFF_NORMED if PYRAMID_COARSE_SQDIFF else cv2.TM_CCOEFF_NORMED
+        if isinstance(small_frame, SharedWindowStats):
+            if PYRAMID_COARSE_SQDIFF:
+                return small_frame.sqdiff_normed(*self._template_pyramid_f32[template_path])
+            return small_frame.ccoeff_normed(*self._template_pyramid_centered[template_path])
+        if self._use_umat:
+            # Coarse pass correlates on the device; the small ROI confirmation stays on the host
+            return cv2.matchTemplate(small_frame, self._template_pyramid_umats[template_path], method)
+        return self._match_into((template_path, "coarse"), small_frame, self._template_pyramids[template_path], method)
+
+    def _match_coarse_to_fine(self, frame, small_frame, template_path, template, ncc_template=None):
+        """Match at PYRAMID_SCALE, then confirm at full scale in a small ROI around the coarse peak.
+
+        Returns (max_val, max_loc) in full-frame coordinates. max_val is always a full-scale
+        TM_CCOEFF_NORMED score; when no full-scale match runs (coarse rejection) it is 0.0, so a
+        rejected template never passes any confidence_threshold or shows up as a coarse score.
+        ncc_template, if given, is a fast_ncc.prepare_template() result used for the confirm step.
+        """
+        result = self._coarse_scores(small_frame, template_path)
+        if PYRAMID_COARSE_SQDIFF:
+            coarse_sqdiff, _, coarse_loc, _ = cv2.minMaxLoc(result)
+            rejected = coarse_sqdiff > PYRAMID_COARSE_MAX_SQDIFF
+        else:
+            _, coarse_val, _, coarse_loc = cv2.minMaxLoc(result)
+            rejected = coarse_val < PYRAMID_COARSE_THRESHOLD
+        if rejected:
+            return 0.0, (int(coarse_loc[0] / PYRAMID_SCALE), int(coarse_loc[1] / PYRAMID_SCALE))
+        
+        h, w = template.shape[:2]
+        frame_h, frame_w = frame.shape[:2]
+        x0 = max(int(coarse_loc[0] / PYRAMID_SCALE) - PYRAMID_ROI_PAD, 0)
+        y0 = max(int(coarse_loc[1] / PYRAMID_SCALE) - PYRAMID_ROI_PAD, 0)
+        x1 = min(x0 + w + 2 * PYRAMID_ROI_PAD, frame_w)
+        y1 = min(y0 + h + 2 * PYRAMID_ROI_PAD, frame_h)
+        roi = frame[y0:y1, x0:x1]
+        if roi.shape[0] < h or roi.shape[1] < w:
+            return 0.0, (x0, y0)
+        
+        if ncc_template is not None:
+            max_val, max_loc = fast_ncc.ncc_confirm(roi, *ncc_template)
+        else:
+            result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, (x0 + max_loc[0], y0 + max_loc[1])
+
+    def _match_in_roi(self, frame, template_list, roi):
+        """Match templates only within ROI_SEARCH_PAD pixels of a previous match rect.
+
+        Returns (confidence, rect, template_path) of the best match.
+        """
+        x, y, w, h = roi
+        frame_h, frame_w = frame.shape[:2]
+        x0, y0 = max(x - ROI_SEARCH_PAD, 0), max(y - ROI_SEARCH_PAD, 0)
+        x1, y1 = min(x + w + ROI_SEARCH_PAD, frame_w), min(y + h + ROI_SEARCH_PAD, frame_h)
+        window = frame[y0:y1, x0:x1]
+        
         best_confidence = 0
         best_rect = None
-        best_template_name = None
+        best_template_path = None
+        for template_path, template in template_list:
+            h, w = template.shape[:2]
+            if window.shape[0] < h or window.shape[1] < w:
+                continue
+            result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if max_val > best_confidence:
+                best_confidence = max_val
+                best_rect = (x0 + max_loc[0], y0 + max_loc[1], w, h)
+                best_template_path = template_path
+                if best_confidence >= EARLY_EXIT_CONFIDENCE:
+                    break
+        return best_confidence, best_rect, best_template_path
+
+    def _promote_template(self, template_list, template_path):
+        """Move a template ahead of those with fewer hits; the list only reorders when it overtakes one."""
+        hits = self._template_hits[template_path]
+        for i, (path, _) in enumerate(template_list):
+            if path == template_path:
+                break
+        else:
+            return
+        j = i
+        while j > 0 and self._template_hits[template_list[j - 1][0]] < hits:
+            j -= 1
+        if j < i:
+            template_list.insert(j, template_list.pop(i))
+
+    def _match_templates(self, img_cv, template_list, state_name, frame=None, small_frame=None):
+        """Match multiple templates against a prepared frame and return the best match.
+
+        frame/small_frame are the host-side full and downscaled frames for the coarse-to-fine
+        path; templates without a pyramid level fall back to a full-frame match on img_cv.
+        A state that matched confidently last time is first searched only around that match.
+        """
+        roi = self._state_rois.get(state_name) if frame is not None else None
+        if roi is not None:
+            best_confidence, best_rect, best_template_path = self._match_in_roi(frame, template_list, roi)
+            if best_confidence >= self.confidence_threshold:
+                self._state_rois[state_name] = best_rect
+            else:
+                # Moved or gone - expire the cache and fall back to a full-frame pass
+                del self._state_rois[state_name]
+                roi = None
+        if roi is None:
+            best_confidence, best_rect, best_template_path = self._search_templates(
+                img_cv, template_list, frame, small_frame
+            )
+            if frame is not None and best_confidence >= self.confidence_threshold:
+                self._state_rois[state_name] = best_rect
+        
+        if best_confidence >= self.confidence_threshold:
+            # Try the most often matching templates first so the early exit triggers sooner.
+            # Keyed by full path: same-named templates in different state directories stay separate
+            self._template_hits[best_template_path] += 1
+            self._promote_template(template_list, best_template_path)
+        
+        best_template_name = self._template_names[best_template_path] if best_template_path else None
+        
+        if DIAGNOSTIC_MODE:
+            self._recent_conf.append((time.time(), state_name, best_confidence, best_template_name))
         
-        # Convert PIL image to OpenCV format once
-        img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+        return best_confidence, best_rect, best_template_name
+
+    def _search_templates(self, img_cv, template_list, frame=None, small_frame=None):
+        """Full-frame search over all templates (coarse-to-fine where a pyramid level exists).
+
+        Returns (confidence, rect, template_path) of the best match.
+        """
+        best_confidence = 0
+        best_rect = None
+        best_template_path = None
         
         for template_path, template in template_list:
             # Get dimensions
             h, w = template.shape[:2]
             
-            # Template matching
-            result = cv2.matchTemplate(img_cv, template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+            if small_frame is not None and template_path in self._template_pyramids:
+                max_val, max_loc = self._match_coarse_to_fine(
+                    frame, small_frame, template_path, template, self._template_ncc.get(template_path)
+                )
+            else:
+                # Template matching (on the OpenCL device when img_cv is a UMat)
+                if self._use_umat:
+                    result = cv2.matchTemplate(img_cv, self._template_umats[template_path], cv2.TM_CCOEFF_NORMED)
+                else:
+                    result = self._match_into((template_path, "full"), img_cv, template, cv2.TM_CCOEFF_NORMED)
+                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
             
             if max_val > best_confidence:
                 best_confidence = max_val
                 best_rect = (max_loc[0], max_loc[1], w, h)
-                best_template_name = os.path.basename(template_path)
+                best_template_path = template_path
+                if best_confidence >= EARLY_EXIT_CONFIDENCE:
+                    break
         
-        if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high" and best_confidence > 0.5:
-            template_info = best_template_name if best_template_name else "no template"
-            print(f"[DIAGNOSTIC] Best {state_name} match: {best_confidence:.2f} ({template_info})")
-            
-            # DIAGNOSTIC: High confidence detection (only show if chosen but not final winner)
-            if best_confidence >= 0.99 and state_name == "idle":
-                print(f"[DIAGNOSTIC] Perfect idle match: {best_confidence:.2f} ({template_info})")
-                print(f"[DIAGNOSTIC] Note: Perfect matches are good if the state is actually idle!")
-        
-        return best_confidence, best_rect, best_template_name
+        return best_confidence, best_rect, best_template_path
 
     def _is_state_change_allowed(self):
         """Check if enough time has passed since last state change."""
@@ -489,9 +1127,11 @@ class EnhancedTemplateMatchDetector:
     def _add_to_history(self, state):
         """Add detection to history for state stability."""
         current_time = time.time()
-        # Keep only recent history (last 10 seconds)
-        self._detection_history = [(t, s) for t, s in self._detection_history if current_time - t < 10]
-        self._detection_history.append((current_time, state))
+        # Keep only recent history (last 10 seconds) - entries are in time order, so expire from the left
+        history = self._detection_history
+        while history and current_time - history[0][0] >= 10:
+            history.popleft()
+        history.append((current_time, state))
 
     def _get_stable_state(self, current_detection):
         """Determine if we have enough consistent detections for a stable state."""
@@ -501,37 +1141,67 @@ class EnhancedTemplateMatchDetector:
             return None
         
         # Check if last N detections are consistent
-        recent_states = [state for _, state in self._detection_history[-self._required_confirmations:]]
-        if all(state == current_detection for state in recent_states):
+        recent = itertools.islice(reversed(self._detection_history), self._required_confirmations)
+        if all(state == current_detection for _, state in recent):
             return current_detection
         
         return None
 
-    def detect_state(self) -> str:
+    def detect_state(self, frame=None, digest=None) -> str:
         try:
-            # Take a screenshot
-            screenshot = pyautogui.screenshot()
+            # Use the monitor's per-tick frame; only grab our own when used standalone
+            screenshot = frame if frame is not None else pyautogui.screenshot()
+            
+            # Convert to OpenCV format once per tick, not once per state
+            host_frame = self._prepare_frame(screenshot)
+            # host_frame is a pure function of frame, so the monitor's digest of frame keys it just as well
+            if digest is None or frame is None:
+                digest = frame_digest(host_frame)
+            cache_key = (host_frame.shape, digest)
+            state_results = self._match_cache.get(cache_key)
+            if state_results is not None:
+                # Seen these exact pixels recently - the per-state matches can't have changed
+                self._match_cache.move_to_end(cache_key)
+            else:
+                small_frame = None
+                if self._template_pyramids:
+                    small_frame = self._downscale_frame(host_frame)
+                    if not self._use_umat and small_frame.ndim == 2:
+                        # One set of integral images serves every template's coarse pass this tick
+                        small_frame = SharedWindowStats(small_frame)
+                frame = host_frame
+                if self._use_umat:
+                    # Upload once per tick; every template then correlates against the same device buffer
+                    frame = cv2.UMat(frame)
+                    if small_frame is not None:
+                        small_frame = cv2.UMat(small_frame)
+            
+                # Match templates for all states
+                state_results = {}
+                for state, template_list in self.loaded_templates.items():
+                    if template_list:  # Only check states that have templates
+                        try:
+                            confidence, rect, template_name = self._match_templates(
+                                frame, template_list, state, host_frame, small_frame
+                            )
+                            state_results[state] = {
+                                'confidence': confidence,
+                                'rect': rect,
+                                'template': template_name
+                            }
+                        except Exception as e:
+                            if DIAGNOSTIC_MODE:
+                                logger.warning("Template matching failed for %s: %s", state, e)
+                            # Set defaults for failed state
+                            state_results[state] = {
+                                'confidence': 0.0,
+                                'rect': None,
+                                'template': None
+                            }
             
-            # Match templates for all states
-            state_results = {}
-            for state, template_list in self.loaded_templates.items():
-                if template_list:  # Only check states that have templates
-                    try:
-                        confidence, rect, template_name = self._match_templates(screenshot, template_list, state)
-                        state_results[state] = {
-                            'confidence': confidence,
-                            'rect': rect,
-                            'template': template_name
-                        }
-                    except Exception as e:
-                        if DIAGNOSTIC_MODE:
-                            print(f"[WARNING] Template matching failed for {state}: {e}")
-                        # Set defaults for failed state
-                        state_results[state] = {
-                            'confidence': 0.0,
-                            'rect': None,
-                            'template': None
-                        }
+                self._match_cache[cache_key] = state_results
+                if len(self._match_cache) > MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
             
             # Store all confidences for debugging - ensure no None values
             self.state_confidences = {}
@@ -596,37 +1266,40 @@ class EnhancedTemplateMatchDetector:
                 else:
                     # Too close - stay unknown to avoid flickering
                     detected_state = AgentState.UNKNOWN
-                    if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high":
-                        print(f"[DIAGNOSTIC] Confidence gap too small ({confidence_gap:.2f}) between {best_state} and {second_state}")
+                    logger.debug("[DIAGNOSTIC] Confidence gap too small (%.2f) between %s and %s",
+                                 confidence_gap, best_state, second_state)
                 
                 # Set results if we chose a state
                 if chosen_result:
                     self.last_confidence = chosen_result['confidence']
                     self._last_match_rect = chosen_result['rect']
                     
-                    if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high":
+                    if logger.isEnabledFor(logging.DEBUG):
                         if detected_state == AgentState.RUN_COMMAND:
                             idle_conf = valid_states.get(AgentState.IDLE, {}).get('confidence', 0.0)
                             active_conf = valid_states.get(AgentState.ACTIVE, {}).get('confidence', 0.0)
                             command_running_conf = valid_states.get(AgentState.COMMAND_RUNNING, {}).get('confidence', 0.0)
-                            print(f"[DIAGNOSTIC] RUN_COMMAND chosen (run:{chosen_result['confidence']:.2f} vs cmd_running:{command_running_conf:.2f} vs idle:{idle_conf:.2f} vs active:{active_conf:.2f})")
+                            logger.debug("[DIAGNOSTIC] RUN_COMMAND chosen (run:%.2f vs cmd_running:%.2f vs idle:%.2f vs active:%.2f)",
+                                         chosen_result['confidence'], command_running_conf, idle_conf, active_conf)
                         elif detected_state == AgentState.COMMAND_RUNNING:
                             idle_conf = valid_states.get(AgentState.IDLE, {}).get('confidence', 0.0)
                             active_conf = valid_states.get(AgentState.ACTIVE, {}).get('confidence', 0.0)
                             run_conf = valid_states.get(AgentState.RUN_COMMAND, {}).get('confidence', 0.0)
-                            print(f"[DIAGNOSTIC] COMMAND_RUNNING chosen (cmd_running:{chosen_result['confidence']:.2f} vs run:{run_conf:.2f} vs idle:{idle_conf:.2f} vs active:{active_conf:.2f})")
+                            logger.debug("[DIAGNOSTIC] COMMAND_RUNNING chosen (cmd_running:%.2f vs run:%.2f vs idle:%.2f vs active:%.2f)",
+                                         chosen_result['confidence'], run_conf, idle_conf, active_conf)
                         else:
-                            print(f"[DIAGNOSTIC] Selected {detected_state} with confidence {chosen_result['confidence']:.2f} (gap: {confidence_gap:.2f})")
+                            logger.debug("[DIAGNOSTIC] Selected %s with confidence %.2f (gap: %.2f)",
+                                         detected_state, chosen_result['confidence'], confidence_gap)
             
             # Apply state stability check
             stable_state = self._get_stable_state(detected_state)
             
             # EXTRA DEBUG: Log state decision process
-            if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high":
-                if detected_state != AgentState.UNKNOWN:
-                    print(f"[STATE_LOGIC] Raw Detection: {detected_state} | Stable State: {stable_state}")
-                    if stable_state != detected_state:
-                        print(f"[STATE_LOGIC] Waiting for more confirmations ({len(self._detection_history)}/{self._required_confirmations})")
+            if detected_state != AgentState.UNKNOWN:
+                logger.debug("[STATE_LOGIC] Raw Detection: %s | Stable State: %s", detected_state, stable_state)
+                if stable_state != detected_state:
+                    logger.debug("[STATE_LOGIC] Waiting for more confirmations (%d/%d)",
+                                 len(self._detection_history), self._required_confirmations)
             
             # Enhanced diagnostic output with better formatting
             if DIAGNOSTIC_MODE and diagnostic_output.should_output():
@@ -665,47 +1338,230 @@ class EnhancedTemplateMatchDetector:
             return detected_state
                 
         except Exception as e:
-            print(f"[ERROR] Enhanced template matching error: {str(e)}")
+            logger.error("Enhanced template matching error: %s", e)
             return AgentState.UNKNOWN
 
 # === OCR Strategy ===
 class OCRDetector:
-    def detect_state(self) -> str:
-        try:
-            screenshot = ImageGrab.grab()
-            text = pytesseract.image_to_string(screenshot)
-            # FIXME: These are not valid for idle states, to remove
-            if "Start a new chat" in text or "Accept" in text:
-                return AgentState.IDLE
-            # FIXME: "Generating" is a valid active state
+    def __init__(self, region=None, window_id=None, focus_rect_source=None):
+        # Only capture the Cursor window instead of the whole (Retina) display
+        self.region = region
+        self.window_id = window_id
+        # Callable returning the last template match rect (display pixels) or None;
+        # when set, OCR runs on a small crop around it instead of the whole window
+        self.focus_rect_source = focus_rect_source
+        self._display_scale = main_display_scale() if focus_rect_source is not None else 1.0
+        self._ocr_lock = threading.Lock()
+        # Screen-change gate: skip OCR when the captured pixels are identical to last time
+        self._last_digest = None
+        self._last_ocr_time = 0
+        self._last_state = AgentState.UNKNOWN
+        # Same stability gate as the template detector: a verdict counts after REQUIRED_CONFIRMATIONS reads
+        self._recent_states = collections.deque(maxlen=REQUIRED_CONFIRMATIONS)
+        self._init_engine()
+
+    def _init_engine(self):
+        """Set up the OCR engine. Subclasses override this for other backends."""
+        # Persistent Tesseract handle - pytesseract forks the CLI and reloads tessdata per call
+        self._tess_api = None
+        if tesserocr is not None:
+            try:
+                self._tess_api = tesserocr.PyTessBaseAPI(
+                    lang='eng', psm=OCR_PAGE_SEG_MODE, oem=tesserocr.OEM.LSTM_ONLY
+                )
+                self._tess_api.SetVariable("tessedit_char_whitelist", OCR_CHAR_WHITELIST)
+                print("[INFO] OCR using in-process tesserocr API")
+            except RuntimeError as e:
+                print(f"[WARNING] tesserocr init failed, falling back to pytesseract: {e}")
+
+    def _image_to_string(self, image) -> str:
+        """Run OCR on a PIL image, preferring the resident tesserocr API."""
+        if self._tess_api is None:
+            return pytesseract.image_to_string(
+                image,
+                lang='eng',
+                config=f"--psm {OCR_PAGE_SEG_MODE} --oem 1 -c tessedit_char_whitelist={OCR_CHAR_WHITELIST}"
+            )
+        # The API object is not thread-safe; GUI and monitor threads may both call in
+        with self._ocr_lock:
+            self._tess_api.SetImage(image)
+            return self._tess_api.GetUTF8Text()
+
+    def close(self):
+        """Release the Tesseract engine."""
+        with self._ocr_lock:
+            if self._tess_api is not None:
+                self._tess_api.End()
+                self._tess_api = None
+
+    def _focus_region(self):
+        """Screen region (points) around the last template match, padded by OCR_FOCUS_PAD."""
+        rect = self.focus_rect_source() if self.focus_rect_source is not None else None
+        if rect is None:
+            return None
+        x, y, w, h = rect
+        left, top, right, bottom = OCR_FOCUS_PAD
+        x0, y0 = max(x - left, 0), max(y - top, 0)
+        scale = self._display_scale
+        return (x0 / scale, y0 / scale, (x + w + right - x0) / scale, (y + h + bottom - y0) / scale)
+
+    def _capture(self):
+        """Grab the OCR source as a CGImage."""
+        # Tesseract time scales with pixel count - prefer the small crop around the input bar
+        focus_region = self._focus_region()
+        if focus_region is not None:
+            cg_image = capture_cg_image(region=focus_region)
+            if cg_image is not None:
+                return cg_image
+        cg_image = capture_cg_image(window_id=self.window_id) if self.window_id is not None else None
+        if cg_image is None:
+            # Window gone (or never found) - fall back to the configured screen region
+            cg_image = capture_cg_image(region=self.region)
+        return cg_image
+
+    def _recognize_text(self, cg_image, frame) -> str:
+        """Extract text from a capture, given as both the CGImage and its BGRA array."""
+        # OCR engines binarize internally - hand them 1 byte/pixel grayscale instead of RGB
+        return self._image_to_string(Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)))
+
+    def _classify_text(self, text) -> str:
+        """Map recognized text to an agent state; UNKNOWN unless a known keyword is present."""
+        # Only positive activity evidence - "Accept"/"Start a new chat" also appear outside idle,
+        # so OCR never reports IDLE and can't trigger the idle notification, sound or key press
+        if "Generating" in text:
             return AgentState.ACTIVE
+        return AgentState.UNKNOWN
+
+    def _confirm(self, state) -> str:
+        """Return state once the last REQUIRED_CONFIRMATIONS reads agree on it, else UNKNOWN."""
+        self._recent_states.append(state)
+        if len(self._recent_states) == self._recent_states.maxlen and all(s == state for s in self._recent_states):
+            return state
+        return AgentState.UNKNOWN
+
+    def detect_state(self, frame=None, digest=None) -> str:
+        # OCR captures its own (cropped) window image rather than the shared full-display frame
+        try:
+            cg_image = self._capture()
+            frame = cgimage_to_array(cg_image)
+            
+            # Hashing the frame costs microseconds; OCR costs tens to hundreds of milliseconds
+            digest = frame_digest(frame)
+            now = time.monotonic()
+            if digest == self._last_digest and now - self._last_ocr_time < OCR_STATE_TTL_SEC:
+                return self._last_state
+            
+            state = self._confirm(self._classify_text(self._recognize_text(cg_image, frame)))
+            self._last_digest = digest
+            self._last_ocr_time = now
+            self._last_state = state
+            return state
         except Exception as e:
-            print(f"[ERROR] OCR detection failed: {e}")
+            logger.error("OCR detection failed: %s", e)
             return AgentState.UNKNOWN
 
+class EasyOCRDetector(OCRDetector):
+    """OCR strategy backed by EasyOCR on the GPU (Metal/MPS or CUDA)."""
+
+    def _init_engine(self):
+        # Imported lazily: torch is a heavy import and only needed for this backend
+        import easyocr
+        import torch
+
+        if not (torch.backends.mps.is_available() or torch.cuda.is_available()):
+            raise RuntimeError("No GPU backend (MPS/CUDA) available for EasyOCR")
+
+        self._tess_api = None
+        self._reader = easyocr.Reader(['en'], gpu=True)
+        print("[INFO] OCR using EasyOCR on GPU")
+
+    def _image_to_string(self, image) -> str:
+        with self._ocr_lock:
+            tokens = self._reader.readtext(np.asarray(image), detail=0, paragraph=False)
+        return " ".join(tokens)
+
+class VisionOCRDetector(OCRDetector):
+    """OCR strategy backed by Apple Vision (Neural Engine/GPU accelerated, in-process)."""
+
+    def _init_engine(self):
+        # Imported lazily: pyobjc-framework-Vision is an optional dependency
+        import Vision
+
+        self._tess_api = None
+        self._vision = Vision
+        # One reusable request - we only look for a few fixed keywords, so fast mode
+        # without language correction is sufficient
+        self._request = Vision.VNRecognizeTextRequest.alloc().init()
+        self._request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelFast)
+        self._request.setUsesLanguageCorrection_(False)
+        print("[INFO] OCR using Apple Vision")
+
+    def _recognize_text(self, cg_image, frame) -> str:
+        # Vision consumes the CGImage directly - no numpy/PIL conversion needed
+        with self._ocr_lock:
+            handler = self._vision.VNImageRequestHandler.alloc().initWithCGImage_options_(cg_image, None)
+            success, error = handler.performRequests_error_([self._request], None)
+            if not success:
+                raise RuntimeError(f"Vision text recognition failed: {error}")
+            lines = []
+            for observation in self._request.results() or []:
+                candidates = observation.topCandidates_(1)
+                if candidates:
+                    lines.append(candidates[0].string())
+        return "\n".join(lines)
+
+def create_ocr_detector(region=None, window_id=None, focus_rect_source=None) -> OCRDetector:
+    """Create the OCR detector selected by OCR_BACKEND, falling back to Tesseract."""
+    if OCR_BACKEND == "easyocr":
+        try:
+            return EasyOCRDetector(region, window_id, focus_rect_source)
+        except (ImportError, RuntimeError) as e:
+            print(f"[WARNING] EasyOCR unavailable, falling back to Tesseract: {e}")
+    elif OCR_BACKEND == "vision":
+        try:
+            return VisionOCRDetector(region, window_id, focus_rect_source)
+        except ImportError as e:
+            print(f"[WARNING] Apple Vision unavailable, falling back to Tesseract: {e}")
+    return OCRDetector(region, window_id, focus_rect_source)
+
 # === Command Queue ===
 class CommandExecutor:
+    """Queue of text commands typed into Cursor.
+
+    Single-consumer contract: any thread may add_command(), but only the monitor thread calls
+    process_next(). deque.append/popleft are atomic in CPython, so no lock is needed as long as
+    that holds.
+    """
+
     def __init__(self):
-        self.queue = queue.Queue()
+        # deque append/popleft are atomic - no Queue mutex/Condition round-trip per command
+        self.queue = collections.deque()
 
     def add_command(self, command: str):
-        self.queue.put(command)
+        self.queue.append(command)
 
     def process_next(self):
-        if not self.queue.empty():
-            command = self.queue.get()
-            pyautogui.write(command)
-            pyautogui.press('enter')
-            return command
-        return None
+        try:
+            command = self.queue.popleft()
+        except IndexError:
+            return None
+        post_text(command)
+        post_key_press(KEYCODE_RETURN)
+        return command
 
 # === Sound Player ===
 # Note: SoundPlayer is now ThreadSafeSoundPlayer (defined above for thread safety)
 
 # === Cursor Agent Monitor ===
 class AgentMonitor:
-    def __init__(self, detectors: list, telemetry: LegacyTelemetryAdapter, executor: Optional[CommandExecutor] = None):
+    def __init__(self, detectors: list, telemetry: LegacyTelemetryAdapter, executor: Optional[CommandExecutor] = None,
+                 frame_grabber: Optional[FrameGrabber] = None):
         self.detectors = detectors
+        self.frame_grabber = frame_grabber or FrameGrabber()
+        # Detectors release the GIL (OpenCV, OCR engines), so untiered they overlap on worker threads
+        self._pool = ThreadPoolExecutor(
+            max_workers=len(detectors), thread_name_prefix="detector", initializer=set_thread_qos
+        ) if len(detectors) > 1 and not TIERED_DETECTORS else None
         self.telemetry = telemetry
         self.executor = executor
         self.state = AgentState.UNKNOWN
@@ -716,7 +1572,11 @@ class AgentMonitor:
         self.last_confidence = None
         self.current_state = AgentState.UNKNOWN
         self.last_screenshot = None
+        self.screenshot_version = 0  # Bumped with every new last_screenshot so viewers can skip repeats
         self.last_detection_rect = None
+        # Screen-change tracking - lets the service back off while nothing on screen moves
+        self._last_frame_digest = None
+        self.frame_changed = True
         # Enhanced state tracking to prevent unnecessary notifications
         self.last_stable_state = AgentState.UNKNOWN
         self.last_notification_time = 0
@@ -839,15 +1699,24 @@ class AgentMonitor:
         if not self.running or self.paused:
             return
 
-        # Take screenshot once for all detectors
-        self.last_screenshot = pyautogui.screenshot()
+        # Take screenshot once for all detectors (BGRA numpy frame)
+        self.last_screenshot = self.frame_grabber.grab()
+        self.screenshot_version += 1
         self.last_detection_rect = None
         
+        digest = frame_digest(self.last_screenshot)
+        self.frame_changed = digest != self._last_frame_digest
+        self._last_frame_digest = digest
+        
         detection_successful = False
 
         # Use the enhanced detector (priority logic now handled in detector)
-        detected_state = self.detectors[0].detect_state()  # Primary detector with priority logic
-        confidence = getattr(self.detectors[0], 'last_confidence', 0.0)
+        if not self.frame_changed and self.state in (AgentState.IDLE, AgentState.ACTIVE) and self.current_state == self.state:
+            # Identical pixels and a confirmed idle/active state - nothing new to match against
+            best_detector, detected_state = self.detectors[0], self.current_state
+        else:
+            best_detector, detected_state = self._run_detectors(self.last_screenshot, digest)
+        confidence = getattr(best_detector, 'last_confidence', None) or 0.0
         
         # Update monitor state
         state = detected_state
@@ -855,17 +1724,14 @@ class AgentMonitor:
         self.last_confidence = confidence
         
         # Update detection rectangle from detector
-        if hasattr(self.detectors[0], '_last_match_rect'):
-            self.last_detection_rect = self.detectors[0]._last_match_rect
-        
-        best_detector = self.detectors[0]
+        if hasattr(best_detector, '_last_match_rect'):
+            self.last_detection_rect = best_detector._last_match_rect
         
         # DEBUG: Log detection decision
-        if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high":
-            if state != AgentState.UNKNOWN:
-                print(f"[DETECTOR_WINNER] {best_detector.__class__.__name__} detected {state} (conf: {confidence:.3f})")
-            else:
-                print(f"[DETECTOR_WINNER] No detector met thresholds")
+        if state != AgentState.UNKNOWN:
+            logger.debug("[DETECTOR_WINNER] %s detected %s (conf: %.3f)", best_detector.__class__.__name__, state, confidence)
+        else:
+            logger.debug("[DETECTOR_WINNER] No detector met thresholds")
         
         # === STATE HANDLING LOGIC (MOVED OUTSIDE DIAGNOSTIC BLOCK) ===
         if state == AgentState.IDLE:
@@ -896,7 +1762,7 @@ class AgentMonitor:
                         self.sound_player.play_sound("idle")
                     
                     if AUTO_CLICK_ENABLED:
-                        pyautogui.press("enter")
+                        post_key_press(KEYCODE_RETURN)
                     if self.executor:
                         cmd = self.executor.process_next()
                         if cmd:
@@ -937,7 +1803,7 @@ class AgentMonitor:
                     # Optional: Auto-click if enabled
                     if AUTO_CLICK_ENABLED:
                         # Could add logic to auto-click the accept button
-                        pyautogui.press("enter")
+                        post_key_press(KEYCODE_RETURN)
             
             # Check for repeating run_command alerts (like idle)
             self._check_run_command_repeat_alert()
@@ -1019,8 +1885,40 @@ class AgentMonitor:
         if not detection_successful and self.current_state == AgentState.UNKNOWN:
             self.telemetry.record_failure("Unable to detect any agent state")
 
+    def _run_detectors(self, frame, digest=None):
+        """Run the detectors; the first in list order with a known state wins.
+
+        Returns (detector, state). Tiered, a detector only runs when all earlier ones returned
+        UNKNOWN; otherwise all run concurrently and latency is the slowest one still needed.
+        A fallback never overrides uncertainty on its own: if it also returns UNKNOWN (OCR does
+        when no state keyword is recognized) the result stays UNKNOWN.
+        digest is the frame_digest() of frame, passed on so detectors don't rehash the frame.
+        """
+        if self._pool is None:
+            for detector in self.detectors:
+                state = detector.detect_state(frame, digest=digest)
+                if state != AgentState.UNKNOWN:
+                    return detector, state
+            return self.detectors[0], AgentState.UNKNOWN
+        
+        futures = [self._pool.submit(detector.detect_state, frame, digest=digest) for detector in self.detectors]
+        for i, (detector, future) in enumerate(zip(self.detectors, futures)):
+            state = future.result()
+            if state != AgentState.UNKNOWN:
+                # Higher-priority answer found - lower-priority results are no longer needed
+                for pending in futures[i + 1:]:
+                    pending.cancel()
+                return detector, state
+        return self.detectors[0], AgentState.UNKNOWN
+
+    def close(self):
+        """Stop the detector worker threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
     def toggle_running(self):
         self.paused = not self.paused
+        self._last_frame_digest = None  # Force a full detection on the next tick
         # NOTE: Disabling sounds for pause and unpause temporarily,
         # but can be enabled in the future
         # if not self.muted:
@@ -1039,6 +1937,28 @@ class AgentMonitor:
         self.paused = False
 
 # === GUI Control Panel ===
+# Fonts and colors are fetched lazily (after NSApp exists) and shared - each bridge call costs a dispatch
+@functools.lru_cache(maxsize=None)
+def ui_font(size, bold=False):
+    return AppKit.NSFont.boldSystemFontOfSize_(size) if bold else AppKit.NSFont.systemFontOfSize_(size)
+
+@functools.lru_cache(maxsize=None)
+def ui_text_color():
+    return AppKit.NSColor.controlTextColor()
+
+@functools.lru_cache(maxsize=None)
+def ui_color(red, green, blue, alpha):
+    return AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(red, green, blue, alpha)
+
+def ui_panel_color(alpha):
+    """Panel background gray, keyed by alpha rounded to 2 decimals so slider drags share entries."""
+    return ui_color(0.2, 0.2, 0.2, round(alpha, 2))
+
+@functools.lru_cache(maxsize=128)
+def format_clock_time(seconds: int) -> str:
+    """HH:MM:SS for a whole-second timestamp; the panel redraws the same few values every tick."""
+    return datetime.fromtimestamp(seconds).strftime("%H:%M:%S")
+
 class ControlPanel(NSObject):
     def initWithMonitor_debugRenderer_(self, monitor, debug_renderer):
         self = objc.super(ControlPanel, self).init()
@@ -1049,7 +1969,23 @@ class ControlPanel(NSObject):
         self.debug_renderer = debug_renderer
         self.debug_window = None
         self.show_debug = False
+        self._debug_visible = False  # Debug window on screen (not minimized, closed or fully covered)
+        self._debug_rendered_version = None  # monitor.screenshot_version last sent to the render worker
+        # Two reused render targets, alternated so the worker never draws into the frame being shown
+        self._debug_bufs = [None, None]
+        self._debug_buf_index = 0
+        # One bitmap rep/image pair reused for every debug frame; rebuilt only when the frame size changes
+        self._debug_rep = None
+        self._debug_image = None
+        # Single-slot, latest-wins handoff from the debug render worker to the main thread
+        self._debug_lock = threading.Lock()
+        self._debug_render_busy = False
+        self._pending_debug_image = None  # Rendered BGRA frame not yet shown
+        self._debug_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-render")
+        self._rendered_text = {}  # control key -> last string/title pushed to AppKit
         self.alpha = 0.95
+        self._last_alpha_apply_ts = 0.0
+        self._alpha_flush_timer = None  # One-shot timer applying the final value of a fast drag
         
         # Create the window - sized for 2x2 grid layout
         self.window = AppKit.NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
@@ -1076,8 +2012,7 @@ class ControlPanel(NSObject):
         self.content_view = AppKit.NSView.alloc().init()
         self.window.setContentView_(self.content_view)
         
-        bg_color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.2, 0.2, self.alpha)
-        self.window.setBackgroundColor_(bg_color)
+        self.window.setBackgroundColor_(ui_panel_color(self.alpha))
         
         self._setup_ui_with_autolayout()
         
@@ -1093,7 +2028,7 @@ class ControlPanel(NSObject):
         self._createMenu()
         
         self.update_timer = AppKit.NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            1.0, self, objc.selector(self.updateDisplay_, signature=b"v@:"), None, True
+            CHECK_INTERVAL_SEC, self, objc.selector(self.updateDisplay_, signature=b"v@:"), None, True
         )
         
         # Start timer to process notifications from background thread (main thread safety)
@@ -1101,6 +2036,11 @@ class ControlPanel(NSObject):
             0.1, self, objc.selector(self.processNotifications_, signature=b"v@:"), None, True
         )
         
+        # Re-resolve capture bounds only when displays are added/removed/resized
+        AppKit.NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, "screenParametersChanged:", AppKit.NSApplicationDidChangeScreenParametersNotification, None
+        )
+        
         return self
 
     def _setup_ui_with_autolayout(self):
@@ -1116,9 +2056,8 @@ class ControlPanel(NSObject):
             label.setDrawsBackground_(False)
             label.setEditable_(False)
             label.setSelectable_(False)
-            font = AppKit.NSFont.boldSystemFontOfSize_(size) if is_bold else AppKit.NSFont.systemFontOfSize_(size)
-            label.setFont_(font)
-            label.setTextColor_(AppKit.NSColor.controlTextColor())
+            label.setFont_(ui_font(size, is_bold))
+            label.setTextColor_(ui_text_color())
             if align == 'right': 
                 label.setAlignment_(AppKit.NSTextAlignmentRight)
             elif align == 'center': 
@@ -1133,7 +2072,7 @@ class ControlPanel(NSObject):
             button = AppKit.NSButton.alloc().init()
             button.setTitle_(title)
             button.setBezelStyle_(AppKit.NSBezelStyleRounded)
-            button.setFont_(AppKit.NSFont.systemFontOfSize_(size))
+            button.setFont_(ui_font(size))
             button.setTranslatesAutoresizingMaskIntoConstraints_(False)
             panel_self.content_view.addSubview_(button)
             return button
@@ -1251,44 +2190,52 @@ class ControlPanel(NSObject):
         status = "Paused" if self.monitor.paused else "Running"
         
         # Add emojis based on state
-        if state == "idle":
-            state_with_emoji = "💤 idle"
-        elif state == "active":
-            state_with_emoji = "🚀 active"
-        elif state == "run_command":
-            state_with_emoji = "⚡ run_command"
-        elif state == "command_running":
-            state_with_emoji = "🔄 command_running"
-        else:
-            state_with_emoji = "❓ Unknown"
+        state_with_emoji = STATE_LABELS.get(state, "❓ Unknown")
+        
+        # Most values are unchanged tick to tick - only touch AppKit when the text differs
+        def set_if_changed(key, control, text, title=False):
+            if self._rendered_text.get(key) != text:
+                self._rendered_text[key] = text
+                if title:
+                    control.setTitle_(text)
+                else:
+                    control.setStringValue_(text)
             
-        self.status_state_label.setStringValue_(f"{state_with_emoji} • {status}")
+        set_if_changed("status", self.status_state_label, f"{state_with_emoji} • {status}")
         
         # Update confidence display
         confidence = f"{self.monitor.last_confidence:.2f}" if self.monitor.last_confidence is not None else "-"
-        self.confidence_label.setStringValue_(f"Confidence: {confidence}")
+        history = getattr(self.monitor.detectors[0], '_recent_conf', None)
+        if history:
+            # list() snapshots the deque so the monitor thread can keep appending
+            recent = [conf for _, state_name, conf, _ in list(history) if state_name == state][-SPARKLINE_LENGTH:]
+            confidence = f"{confidence} {confidence_sparkline(recent)}"
+        set_if_changed("confidence", self.confidence_label, f"Confidence: {confidence}")
         
         # Update button states - 2x2 grid with larger emoji buttons
-        self.toggle_btn.setTitle_("▶️" if self.monitor.paused else "⏸️")
-        self.mute_btn.setTitle_("🔇" if self.monitor.muted else "🔊")
-        self.stats_btn.setTitle_("📊")
-        self.debug_btn.setTitle_("🐛")
+        set_if_changed("toggle", self.toggle_btn, "▶️" if self.monitor.paused else "⏸️", title=True)
+        set_if_changed("mute", self.mute_btn, "🔇" if self.monitor.muted else "🔊", title=True)
         
         # Update stats window if open
         if self.show_stats and hasattr(self, 'stats_detections_label'):
-            self.stats_detections_label.setStringValue_(f"{self.monitor.telemetry.idle_detections}")
-            self.stats_failures_label.setStringValue_(f"{self.monitor.telemetry.detection_failures}")
+            set_if_changed("stats_detections", self.stats_detections_label, f"{self.monitor.telemetry.idle_detections}")
+            set_if_changed("stats_failures", self.stats_failures_label, f"{self.monitor.telemetry.detection_failures}")
             last_detection_time = self._formatTime_(self.monitor.telemetry.last_idle_detection)
-            self.stats_last_detection_label.setStringValue_(f"{last_detection_time}")
+            set_if_changed("stats_last_detection", self.stats_last_detection_label, f"{last_detection_time}")
         
-        self._updateDebugView_(None)
+        if self.show_debug:
+            self._updateDebugView_(None)
+
+    def screenParametersChanged_(self, notification):
+        """Display configuration changed - drop the cached capture bounds."""
+        self.monitor.frame_grabber.invalidate()
 
     def processNotifications_(self, timer):
         """Process queued notifications on main thread. Called by timer every 100ms."""
         try:
             _notification_queue.process_notifications()
         except Exception as e:
-            print(f"[ERROR] Failed to process notifications: {e}")
+            logger.error("Failed to process notifications: %s", e)
 
     def toggleMonitor_(self, sender):
         self.monitor.toggle_running()
@@ -1318,6 +2265,11 @@ class ControlPanel(NSObject):
         else:
             if self.debug_window:
                 self.debug_window.orderOut_(None)
+                # Release the frame buffer while hidden instead of keeping it until the next one
+                self.debug_image_view.setImage_(None)
+                self._debug_rep = self._debug_image = None
+                self._debug_bufs = [None, None]
+                self._debug_rendered_version = None  # Redraw the current frame when shown again
             
     def _createStatsWindow(self):
         """Create the statistics popup window."""
@@ -1339,63 +2291,56 @@ class ControlPanel(NSObject):
         y = main_frame.origin.y
         self.stats_window.setFrameOrigin_(NSMakePoint(x, y))
         
-        bg_color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.2, 0.2, 0.95)
-        self.stats_window.setBackgroundColor_(bg_color)
+        self.stats_window.setBackgroundColor_(ui_panel_color(0.95))
+        
+        # Static layout: precomputed frames pinned by autoresizing masks - no constraint solver pass.
+        # Cocoa's origin is bottom-left, so rows are placed from the top edge downwards.
+        width, height = 300, 200
+        padding = 20
+        line_spacing = 15
+        title_height = 22
+        row_height = 18
+        key_width, value_width = 150, 110
         
         # Create content view
-        content_view = AppKit.NSView.alloc().init()
+        content_view = AppKit.NSView.alloc().initWithFrame_(NSMakeRect(0, 0, width, height))
         self.stats_window.setContentView_(content_view)
         
         # Create labels
-        def create_stats_label(text, size=12, is_bold=False):
-            label = self.createStyledLabelWithFrame_text_(NSMakeRect(0,0,0,0), text)
-            font = AppKit.NSFont.boldSystemFontOfSize_(size) if is_bold else AppKit.NSFont.systemFontOfSize_(size)
-            label.setFont_(font)
-            label.setTranslatesAutoresizingMaskIntoConstraints_(False)
+        def create_stats_label(text, frame, mask, size=12, is_bold=False):
+            label = self.createStyledLabelWithFrame_text_(frame, text)
+            label.setFont_(ui_font(size, is_bold))
+            label.setAutoresizingMask_(mask)
             content_view.addSubview_(label)
             return label
         
-        title_label = create_stats_label("Statistics", 16, is_bold=True)
-        
-        detections_key = create_stats_label("Idle Detections:")
-        self.stats_detections_label = create_stats_label("0")
-        self.stats_detections_label.setAlignment_(AppKit.NSTextAlignmentRight)
-        
-        failures_key = create_stats_label("Detection Failures:")
-        self.stats_failures_label = create_stats_label("0")
-        self.stats_failures_label.setAlignment_(AppKit.NSTextAlignmentRight)
-        
-        last_detection_key = create_stats_label("Last Idle Detection:")
-        self.stats_last_detection_label = create_stats_label("Never")
-        self.stats_last_detection_label.setAlignment_(AppKit.NSTextAlignmentRight)
-        
-        # Layout with constraints
-        padding = 20
-        line_spacing = 15
-        NSLayoutConstraint.activateConstraints_([
-            title_label.topAnchor().constraintEqualToAnchor_constant_(content_view.topAnchor(), padding),
-            title_label.centerXAnchor().constraintEqualToAnchor_(content_view.centerXAnchor()),
-            
-            detections_key.topAnchor().constraintEqualToAnchor_constant_(title_label.bottomAnchor(), padding),
-            detections_key.leadingAnchor().constraintEqualToAnchor_constant_(content_view.leadingAnchor(), padding),
-            self.stats_detections_label.topAnchor().constraintEqualToAnchor_(detections_key.topAnchor()),
-            self.stats_detections_label.trailingAnchor().constraintEqualToAnchor_constant_(content_view.trailingAnchor(), -padding),
-            
-            failures_key.topAnchor().constraintEqualToAnchor_constant_(detections_key.bottomAnchor(), line_spacing),
-            failures_key.leadingAnchor().constraintEqualToAnchor_constant_(content_view.leadingAnchor(), padding),
-            self.stats_failures_label.topAnchor().constraintEqualToAnchor_(failures_key.topAnchor()),
-            self.stats_failures_label.trailingAnchor().constraintEqualToAnchor_constant_(content_view.trailingAnchor(), -padding),
-            
-            last_detection_key.topAnchor().constraintEqualToAnchor_constant_(failures_key.bottomAnchor(), line_spacing),
-            last_detection_key.leadingAnchor().constraintEqualToAnchor_constant_(content_view.leadingAnchor(), padding),
-            self.stats_last_detection_label.topAnchor().constraintEqualToAnchor_(last_detection_key.topAnchor()),
-            self.stats_last_detection_label.trailingAnchor().constraintEqualToAnchor_constant_(content_view.trailingAnchor(), -padding),
-            self.stats_last_detection_label.bottomAnchor().constraintLessThanOrEqualToAnchor_constant_(content_view.bottomAnchor(), -padding),
-        ])
+        pin_top = AppKit.NSViewMinYMargin  # Keep the distance to the top edge when the window resizes
+        y = height - padding - title_height
+        title_label = create_stats_label(
+            "Statistics", NSMakeRect(padding, y, width - 2 * padding, title_height),
+            pin_top | AppKit.NSViewWidthSizable, 16, is_bold=True
+        )
+        title_label.setAlignment_(AppKit.NSTextAlignmentCenter)
+        
+        value_labels = []
+        y -= padding + row_height
+        for key_text, value_text in (("Idle Detections:", "0"), ("Detection Failures:", "0"), ("Last Idle Detection:", "Never")):
+            create_stats_label(key_text, NSMakeRect(padding, y, key_width, row_height), pin_top | AppKit.NSViewMaxXMargin)
+            value_label = create_stats_label(
+                value_text, NSMakeRect(width - padding - value_width, y, value_width, row_height),
+                pin_top | AppKit.NSViewMinXMargin
+            )
+            value_label.setAlignment_(AppKit.NSTextAlignmentRight)
+            value_labels.append(value_label)
+            y -= line_spacing + row_height
+        self.stats_detections_label, self.stats_failures_label, self.stats_last_detection_label = value_labels
 
     def _createDebugWindow(self):
+        # Final position up front (left of the main window), so the window is laid out once
+        width, height = 400, 300
+        main_frame = self.window.frame()
         self.debug_window = AppKit.NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            NSMakeRect(0, 0, 400, 300),
+            NSMakeRect(main_frame.origin.x - width - 20, main_frame.origin.y, width, height),
             AppKit.NSWindowStyleMaskTitled | 
             AppKit.NSWindowStyleMaskClosable |
             AppKit.NSWindowStyleMaskResizable,
@@ -1405,34 +2350,64 @@ class ControlPanel(NSObject):
         self.debug_window.setTitle_("Debug View")
         self.debug_window.setBackgroundColor_(AppKit.NSColor.blackColor())
         self.debug_image_view = AppKit.NSImageView.alloc().initWithFrame_(
-            NSMakeRect(0, 0, 400, 300)
+            NSMakeRect(0, 0, width, height)
         )
         self.debug_image_view.setImageScaling_(AppKit.NSImageScaleProportionallyUpOrDown)
         self.debug_window.setContentView_(self.debug_image_view)
-        main_frame = self.window.frame()
-        debug_frame = self.debug_window.frame()
-        new_x = main_frame.origin.x - debug_frame.size.width - 20
-        new_y = main_frame.origin.y
-        self.debug_window.setFrameOrigin_(NSMakePoint(new_x, new_y))
+        # Track visibility from notifications rather than querying the window every tick
+        AppKit.NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, "debugWindowOcclusionChanged:", AppKit.NSWindowDidChangeOcclusionStateNotification, self.debug_window
+        )
         
+    def debugWindowOcclusionChanged_(self, notification):
+        """Minimized, closed, on another Space or fully covered - stop rendering frames nobody sees."""
+        self._debug_visible = bool(self.debug_window.occlusionState() & AppKit.NSWindowOcclusionStateVisible)
+
     def _updateDebugView_(self, sender):
-        if not self.show_debug or not self.debug_window:
+        if not self.show_debug or not self.debug_window or not self._debug_visible:
             return
             
         # Update debug window background color based on state
         current_state = self.monitor.current_state if self.monitor.current_state else "unknown"
         if current_state == "command_running":
             # Blue background for command_running state
-            blue_color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.0, 0.3, 0.8, 0.95)
-            self.debug_window.setBackgroundColor_(blue_color)
+            self.debug_window.setBackgroundColor_(ui_color(0.0, 0.3, 0.8, 0.95))
         else:
             # Default black background for other states
             self.debug_window.setBackgroundColor_(AppKit.NSColor.blackColor())
-        if hasattr(self.monitor, 'last_screenshot') and self.monitor.last_screenshot is not None:
-            try:
-                img_array = np.array(self.monitor.last_screenshot)
-                height, width, _ = img_array.shape
-                
+        if self.monitor.last_screenshot is None:
+            return
+        version = self.monitor.screenshot_version
+        if version == self._debug_rendered_version:
+            return  # No scan since the last render - the frame and overlay would be identical
+        with self._debug_lock:
+            if self._debug_render_busy:
+                return  # Previous frame still rendering - drop this one rather than queueing behind it
+            self._debug_render_busy = True
+        self._debug_rendered_version = version
+        # Resize + overlay run off the main thread; only the pixel copy into the view's bitmap happens there
+        self._debug_executor.submit(self.renderDebugFrame)
+
+    def renderDebugFrame(self):
+        """Render the latest screenshot with its detection overlay (debug worker thread)."""
+        try:
+            # Worker threads have no run loop pool - drain the frame's Cocoa temporaries every render
+            with objc.autorelease_pool():
+                frame = self.monitor.last_screenshot
+                # The view is a few hundred points wide - shrinking first means the overlay and the copy
+                # into the view touch a fraction of a Retina capture's pixels (the resize also makes the copy we draw on)
+                scale = min(1.0, DEBUG_VIEW_MAX_WIDTH / frame.shape[1])
+                size = (max(1, round(frame.shape[1] * scale)), max(1, round(frame.shape[0] * scale)))
+                self._debug_buf_index ^= 1
+                img_array = self._debug_bufs[self._debug_buf_index]
+                if img_array is None or img_array.shape != (size[1], size[0], frame.shape[2]):
+                    img_array = np.empty((size[1], size[0], frame.shape[2]), dtype=np.uint8)
+                    self._debug_bufs[self._debug_buf_index] = img_array
+                if scale < 1.0:
+                    cv2.resize(frame, size, dst=img_array, interpolation=cv2.INTER_AREA)
+                else:
+                    np.copyto(img_array, frame)  # Copy - the overlay draws in place
+            
                 # Check for detection rectangle - try multiple possible attribute names
                 rect = None
                 if hasattr(self.monitor, 'last_detection_rect') and self.monitor.last_detection_rect is not None:
@@ -1449,7 +2424,7 @@ class ControlPanel(NSObject):
                     elif hasattr(detector, 'last_match_rect') and detector.last_match_rect is not None:
                         rect = detector.last_match_rect
                         self.monitor.last_detection_rect = rect
-                
+            
                 # Draw rectangle if we found one
                 if rect is not None:
                     # Ensure rect has 4 values (x, y, width, height)
@@ -1458,37 +2433,49 @@ class ControlPanel(NSObject):
                         current_state = self.monitor.current_state or "unknown"
                         img_array = self.debug_renderer.render_detection_overlay(
                             image_array=img_array,
-                            detection_rect=rect,
+                            detection_rect=tuple(int(v * scale) for v in rect[:4]),
                             state=current_state,
                             confidence=self.monitor.last_confidence
                         )
-                
-                # Convert to RGB and save as temporary PNG file
-                img_array_rgb = cv2.cvtColor(img_array, cv2.COLOR_BGR2RGB)
-                
-                # Use PIL to create the image data more safely
-                from PIL import Image
-                pil_img = Image.fromarray(img_array_rgb)
-                
-                # Convert to NSImage via temporary file path
-                import tempfile
-                import os
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    pil_img.save(tmp.name, 'PNG')
-                    ns_image = AppKit.NSImage.alloc().initWithContentsOfFile_(tmp.name)
-                    os.unlink(tmp.name)  # Clean up temp file
-                
-                if ns_image:
-                    self.debug_image_view.setImage_(ns_image)
-            except Exception as e:
-                print(f"[ERROR] Debug view update failed: {e}")
-                import traceback
-                traceback.print_exc()
+            
+                    img_array[:, :, 3] = 255  # cv2 drawing zeroes alpha under 3-channel colors
+            
+                # Latest wins: a frame the main thread hasn't shown yet is simply replaced
+                with self._debug_lock:
+                    self._pending_debug_image = img_array
+                self.performSelectorOnMainThread_withObject_waitUntilDone_("applyPendingDebugImage:", None, False)
+        except Exception:
+            logger.exception("Debug view update failed")
+        finally:
+            with self._debug_lock:
+                self._debug_render_busy = False
+
+    def applyPendingDebugImage_(self, _):
+        """Show the newest rendered debug frame (main thread)."""
+        with self._debug_lock:
+            pending, self._pending_debug_image = self._pending_debug_image, None
+        if pending is None or not self.show_debug:
+            return
+        height, width, _ = pending.shape
+        if self._debug_rep is None or (self._debug_rep.pixelsWide(), self._debug_rep.pixelsHigh()) != (width, height):
+            # 32-bit little-endian alpha-first is BGRA in memory - the frame's own layout, copied as-is
+            self._debug_rep = AppKit.NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bitmapFormat_bytesPerRow_bitsPerPixel_(
+                None, width, height, 8, 4, True, False, AppKit.NSDeviceRGBColorSpace,
+                AppKit.NSBitmapFormatAlphaFirst | AppKit.NSBitmapFormatThirtyTwoBitLittleEndian, width * 4, 32
+            )
+            self._debug_image = AppKit.NSImage.alloc().initWithSize_((width, height))
+            self._debug_image.setCacheMode_(AppKit.NSImageCacheNever)  # Always draw the rep's current pixels
+            self._debug_image.addRepresentation_(self._debug_rep)
+        pixels = np.frombuffer(self._debug_rep.bitmapData(), dtype=np.uint8, count=pending.size)
+        np.copyto(pixels.reshape(pending.shape), pending)
+        if self.debug_image_view.image() is not self._debug_image:
+            self.debug_image_view.setImage_(self._debug_image)
+        self.debug_image_view.setNeedsDisplay_(True)
             
     def _formatTime_(self, timestamp):
         if timestamp is None:
             return "Never"
-        return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+        return format_clock_time(int(timestamp))
         
     def _createMenu(self):
         menubar = AppKit.NSMenu.alloc().init()
@@ -1502,11 +2489,24 @@ class ControlPanel(NSObject):
         AppKit.NSApp().setMainMenu_(menubar)
 
     def _updateBackgroundColor(self):
-        color = AppKit.NSColor.colorWithCalibratedRed_green_blue_alpha_(0.2, 0.2, 0.2, self.alpha)
-        self.window.setBackgroundColor_(color)
+        self.window.setBackgroundColor_(ui_panel_color(self.alpha))
 
     def changeAlpha_(self, sender):
         self.alpha = sender.floatValue()
+        # Re-tint at most ~60 times a second while dragging; the trailing timer applies the last value
+        wait = ALPHA_APPLY_INTERVAL_SEC - (time.monotonic() - self._last_alpha_apply_ts)
+        if wait <= 0:
+            self.flushAlpha_(None)
+        elif self._alpha_flush_timer is None:
+            self._alpha_flush_timer = AppKit.NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                wait, self, "flushAlpha:", None, False
+            )
+
+    def flushAlpha_(self, timer):
+        if self._alpha_flush_timer is not None:
+            self._alpha_flush_timer.invalidate()
+            self._alpha_flush_timer = None
+        self._last_alpha_apply_ts = time.monotonic()
         self._updateBackgroundColor()
 
     def toggleAlphaSlider_(self, sender):
@@ -1516,7 +2516,7 @@ class ControlPanel(NSObject):
         button = AppKit.NSButton.alloc().initWithFrame_(frame)
         button.setTitle_(title)
         button.setBezelStyle_(AppKit.NSBezelStyleRounded)
-        button.setFont_(AppKit.NSFont.systemFontOfSize_(12))
+        button.setFont_(ui_font(12))
         return button
 
     def createStyledLabelWithFrame_text_(self, frame, text):
@@ -1526,8 +2526,8 @@ class ControlPanel(NSObject):
         label.setDrawsBackground_(False)
         label.setEditable_(False)
         label.setSelectable_(False)
-        label.setFont_(AppKit.NSFont.systemFontOfSize_(12))
-        label.setTextColor_(AppKit.NSColor.controlTextColor())
+        label.setFont_(ui_font(12))
+        label.setTextColor_(ui_text_color())
         return label
 
     def createStyledBoxWithFrame_title_(self, frame, title):
@@ -1542,24 +2542,148 @@ class ControlPanel(NSObject):
 class AgentWatcherService:
     def __init__(self, monitor: AgentMonitor):
         self.monitor = monitor
-        self.thread = threading.Thread(target=self.run_loop, daemon=True)
+        self.interval = CHECK_INTERVAL_SEC
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run_loop, name="agent-watcher", daemon=True)
+
+    def _next_interval(self):
+        """Back off while the screen is static; snap back to the base rate on any change."""
+        if self.monitor.frame_changed:
+            self.interval = CHECK_INTERVAL_SEC
+        else:
+            self.interval = min(MAX_CHECK_INTERVAL_SEC, self.interval * CHECK_INTERVAL_BACKOFF)
+        return self.interval
 
     def run_loop(self):
-        while True:
+        set_thread_qos()  # Utility QoS: the scheduler may run scans on efficiency cores, away from the UI
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
             try:
                 self.monitor.scan_and_act()
-                time.sleep(CHECK_INTERVAL_SEC)
-            except Exception as e:
-                print(f"[ERROR] Monitor loop error: {e}")
-                import traceback
-                traceback.print_exc()
+                interval = self._next_interval()
+            except Exception:
+                # Only enqueues the raw record - DroppingQueueHandler skips QueueHandler's eager
+                # formatting, so the traceback is formatted and written on the listener thread
+                logger.exception("Monitor loop error")
                 # Continue running after errors - don't crash the whole app
-                time.sleep(CHECK_INTERVAL_SEC)
+                interval = CHECK_INTERVAL_SEC
+            
+            # Schedule from the previous tick, not from "now", so scan time doesn't add drift.
+            # If a scan overran, start the next one immediately rather than bursting to catch up.
+            now = time.monotonic()
+            next_tick = max(next_tick + interval, now)
+            if self._stop_event.wait(next_tick - now):
+                break
 
     def start(self):
         print("[INFO] Starting AgentWatcherService...")
         self.thread.start()
 
+    def stop(self, timeout: float = 5.0):
+        """Wake the loop and wait for the in-flight scan to finish."""
+        self._stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+        self.monitor.close()
+
+class DispatchWatcherService(AgentWatcherService):
+    """Watcher driven by a GCD timer on a utility-QoS global queue instead of a Python sleep loop.
+
+    The kernel fires the timer (with WATCHER_TIMER_LEEWAY slack for wakeup coalescing), and a
+    dispatch source never runs its handler concurrently with itself, so scans stay serialized.
+    """
+
+    def __init__(self, monitor: AgentMonitor):
+        super().__init__(monitor)
+        self._source = None
+        self._scan_lock = threading.Lock()  # Held while a tick runs, so stop() can wait for it
+
+    def _arm(self, interval):
+        """(Re)schedule a single tick `interval` seconds from now; _tick re-arms after each scan."""
+        nanos = int(interval * dispatch.NSEC_PER_SEC)
+        dispatch.dispatch_source_set_timer(
+            self._source,
+            dispatch.dispatch_time(dispatch.DISPATCH_TIME_NOW, nanos),
+            dispatch.DISPATCH_TIME_FOREVER,  # One-shot: never repeats on its own
+            int(max(nanos, dispatch.NSEC_PER_SEC) * WATCHER_TIMER_LEEWAY)
+        )
+
+    def _tick(self):
+        with self._scan_lock:
+            if self._stop_event.is_set():
+                return
+            try:
+                self.monitor.scan_and_act()
+                interval = self._next_interval()
+            except Exception:
+                logger.exception("Monitor loop error")
+                interval = CHECK_INTERVAL_SEC
+            self._arm(interval)
+
+    def start(self):
+        print("[INFO] Starting AgentWatcherService (GCD timer)...")
+        target_queue = dispatch.dispatch_get_global_queue(dispatch.QOS_CLASS_UTILITY, 0)
+        self._source = dispatch.dispatch_source_create(dispatch.DISPATCH_SOURCE_TYPE_TIMER, 0, 0, target_queue)
+        dispatch.dispatch_source_set_event_handler(self._source, self._tick)
+        self._arm(0)
+        dispatch.dispatch_resume(self._source)
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel the timer and wait for an in-flight scan to finish."""
+        self._stop_event.set()
+        if self._source is not None:
+            dispatch.dispatch_source_cancel(self._source)
+        if self._scan_lock.acquire(timeout=timeout):
+            self._scan_lock.release()
+        self.monitor.close()
+
+def create_watcher_service(monitor: AgentMonitor) -> AgentWatcherService:
+    """Create the watcher selected by WATCHER_SCHEDULER, falling back to the thread loop."""
+    if WATCHER_SCHEDULER == "dispatch":
+        if dispatch is not None:
+            return DispatchWatcherService(monitor)
+        print("[WARNING] libdispatch bindings unavailable, falling back to the watcher thread")
+    return AgentWatcherService(monitor)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records when the bounded queue is full instead of blocking or erroring."""
+
+    def prepare(self, record):
+        # The base class formats the message and traceback here, on the logging thread, so the
+        # record can be pickled. The queue is in-process - pass the record through untouched and
+        # let the listener's handlers format it (and never format records that get dropped)
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+def configure_logging():
+    """Route log records through a bounded queue so scan/render threads never block on stream/file I/O.
+
+    Records are queued unformatted (see DroppingQueueHandler.prepare); message and traceback
+    formatting happen on the listener thread along with the I/O. Returns the started
+    QueueListener; call stop() on it at shutdown to flush pending records.
+    """
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    # Per-scan detection traces are DEBUG records - only formatted when high verbosity asks for them
+    if DIAGNOSTIC_MODE and DIAGNOSTIC_VERBOSITY == "high":
+        logger.setLevel(logging.DEBUG)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(threadName)s: %(message)s")
+    handlers = [logging.StreamHandler(), logging.FileHandler(LOG_FILE)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
 def signal_handler(signum, frame):
     """Handle Ctrl+C gracefully."""
     print("\n👋 Received interrupt signal. Shutting down Agent Monitor...")
@@ -1575,10 +2699,34 @@ def main():
     print("   Or use Cmd+Q to quit from the app menu")
     print("")
     
+    log_listener = configure_logging()
+    service = None
+    telemetry = None
+    stopped = False
+    
+    def shutdown():
+        """Stop the watcher, flush queued telemetry and drain the log queue (once)."""
+        nonlocal stopped
+        if stopped:
+            return
+        stopped = True
+        if service is not None:
+            service.stop()
+        if telemetry is not None:
+            telemetry.close()
+        log_listener.stop()
+        print("✅ Agent Monitor stopped.")
+    
+    # NSApp().terminate_ (Cmd+Q, SIGINT/SIGTERM) exits the process without returning from run(),
+    # so the finally block below never runs on a normal quit; atexit is the fallback
+    atexit.register(shutdown)
     try:
         # Initialize NSApplication
         app = AppKit.NSApplication.sharedApplication()
         app.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
+        AppKit.NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            AppKit.NSApplicationWillTerminateNotification, app, None, lambda notification: shutdown()
+        )
         
         # Initialize telemetry with dependency injection
         container = initialize_telemetry_system()
@@ -1611,12 +2759,24 @@ def main():
                 min_confidence_gap=MIN_CONFIDENCE_GAP
             )]
         
+        frame_grabber = FrameGrabber(track_window=CAPTURE_CURSOR_WINDOW)
+        
         if OCR_ENABLED:
-            detectors.append(OCRDetector())
+            # Resolve the capture region once rather than grabbing the full display every tick
+            cursor_window_id, cursor_bounds = find_cursor_window()
+            ocr_region = CURSOR_REGION or cursor_bounds
+            if cursor_window_id is None and ocr_region is None:
+                print(f"[WARNING] {CURSOR_APP_NAME} window not found - OCR will capture the full screen")
+            # Crop OCR to the area around the template detector's last match when it has one
+            template_detector = detectors[0]
+            detectors.append(create_ocr_detector(
+                ocr_region, cursor_window_id,
+                focus_rect_source=lambda: frame_grabber.to_display_rect(getattr(template_detector, '_last_match_rect', None))
+            ))
 
         # Create and start the monitor
-        monitor = AgentMonitor(detectors, telemetry, executor)
-        service = AgentWatcherService(monitor)
+        monitor = AgentMonitor(detectors, telemetry, executor, frame_grabber)
+        service = create_watcher_service(monitor)
         service.start()
 
         # Start the control panel
@@ -1630,7 +2790,7 @@ def main():
     except Exception as e:
         print(f"\n❌ Error starting application: {e}")
     finally:
-        print("✅ Agent Monitor stopped.")
+        shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Numba NCC Kernel
+
+Scores a grayscale template at every offset of a small region of interest using the same
+formula as cv2.TM_CCOEFF_NORMED. Used for the full-scale confirm step of the coarse-to-fine
+template search, where the region is only a few dozen pixels larger than the template and
+OpenCV's per-call setup and allocation dominate the actual correlation work.
+
+Requires numba (pip install numba); importing this module raises ImportError without it.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+# Explicit signatures pin one compiled specialization; "[:, :]" (any layout) accepts the sliced,
+# non-contiguous ROI views the confirm step passes, so no second compile happens at runtime.
+@njit("UniTuple(float64[:, ::1], 2)(uint8[:, :])", cache=True, nogil=True)
+def _integral(img):
+    """Summed-area tables of pixel values and squared pixel values, padded by one row/column."""
+    h, w = img.shape
+    sums = np.zeros((h + 1, w + 1), dtype=np.float64)
+    sqsums = np.zeros((h + 1, w + 1), dtype=np.float64)
+    for y in range(h):
+        row_sum = 0.0
+        row_sqsum = 0.0
+        for x in range(w):
+            v = float(img[y, x])
+            row_sum += v
+            row_sqsum += v * v
+            sums[y + 1, x + 1] = sums[y, x + 1] + row_sum
+            sqsums[y + 1, x + 1] = sqsums[y, x + 1] + row_sqsum
+    return sums, sqsums
+
+
+@njit("float64[:, ::1](uint8[:, :], float64[:, :], float64)", cache=True, nogil=True, parallel=True, fastmath=True)
+def ncc_scores(roi, tmpl_centered, tmpl_norm):
+    """TM_CCOEFF_NORMED score map of a mean-centered template over every offset of roi."""
+    th, tw = tmpl_centered.shape
+    out_h = roi.shape[0] - th + 1
+    out_w = roi.shape[1] - tw + 1
+    n = th * tw
+    sums, sqsums = _integral(roi)
+    scores = np.zeros((out_h, out_w), dtype=np.float64)
+    for y in prange(out_h):
+        for x in range(out_w):
+            # The template is zero-mean, so the window mean drops out of the numerator
+            cross = 0.0
+            for ty in range(th):
+                for tx in range(tw):
+                    cross += roi[y + ty, x + tx] * tmpl_centered[ty, tx]
+            window_sum = sums[y + th, x + tw] - sums[y, x + tw] - sums[y + th, x] + sums[y, x]
+            window_sqsum = sqsums[y + th, x + tw] - sqsums[y, x + tw] - sqsums[y + th, x] + sqsums[y, x]
+            variance = window_sqsum - window_sum * window_sum / n
+            denom = np.sqrt(max(variance, 0.0)) * tmpl_norm
+            if denom > 1e-9:
+                scores[y, x] = cross / denom
+    return scores
+
+
+def prepare_template(template):
+    """Precompute the mean-centered template and its L2 norm (once, at template load)."""
+    centered = template.astype(np.float64)
+    centered -= centered.mean()
+    return centered, float(np.sqrt((centered * centered).sum()))
+
+
+def ncc_confirm(roi, tmpl_centered, tmpl_norm):
+    """Return (max_val, (x, y)) of the best template offset within roi."""
+    scores = ncc_scores(roi, tmpl_centered, tmpl_norm)
+    y, x = np.unravel_index(np.argmax(scores), scores.shape)
+    return float(scores[y, x]), (int(x), int(y))
+
+
+# Warm up at import with a sliced view, the same array layout as the real ROI
+ncc_confirm(np.zeros((8, 8), dtype=np.uint8)[1:5, 1:5], *prepare_template(np.zeros((2, 2), dtype=np.uint8)))
@@ -21,6 +21,10 @@ class TelemetryRepository(Protocol):
         """Log a telemetry event. Returns the event ID."""
         ...
     
+    def log_events(self, events: List[TelemetryEvent]) -> None:
+        """Log several telemetry events in a single transaction."""
+        ...
+    
     def get_events(self, 
                   start_time: Optional[datetime] = None,
                   end_time: Optional[datetime] = None,
@@ -35,6 +39,12 @@ class TelemetryRepository(Protocol):
         """Get aggregated statistics for a time period."""
         ...
     
+    def get_detection_counters(self, 
+                               start_time: Optional[datetime] = None,
+                               end_time: Optional[datetime] = None) -> SessionStats:
+        """Get only idle/failure counts and the last event time for a time period."""
+        ...
+    
     def cleanup_old_data(self, days_to_keep: int = 30) -> int:
         """Clean up old data. Returns number of records removed."""
         ...
@@ -53,6 +63,10 @@ class TelemetryService(Protocol):
         """Record a detection event with specified type and optional parameters."""
         ...
     
+    def record_detections(self, records: List[Dict[str, Any]]) -> None:
+        """Record several detection events at once (record_detection kwargs plus optional 'timestamp')."""
+        ...
+    
     def record_event(self, 
                     event_type: EventType,
                     message: str = None,
@@ -60,8 +74,8 @@ class TelemetryService(Protocol):
         """Record any type of event with flexible parameters."""
         ...
     
-    def get_recent_stats(self, hours: int = 24) -> SessionStats:
-        """Get statistics for recent activity."""
+    def get_recent_stats(self, hours: int = 24, lightweight: bool = False) -> SessionStats:
+        """Get statistics for recent activity (only the detection counters when lightweight)."""
         ...
 
 class AnalyticsService(Protocol):
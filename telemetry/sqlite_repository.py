@@ -29,13 +29,21 @@ class SQLiteTelemetryRepository:
     def initialize(self) -> None:
         """Initialize the database with required tables."""
         with sqlite3.connect(self.db_path) as conn:
+            # WAL is persistent per database file: readers no longer block the telemetry writer
+            conn.execute("PRAGMA journal_mode=WAL")
             for schema in DatabaseSchema.get_all_schemas():
                 conn.execute(schema)
             conn.commit()
     
+    def _connect_for_write(self) -> sqlite3.Connection:
+        """Open a connection tuned for appends (WAL makes synchronous=NORMAL crash-safe)."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
     def log_event(self, event: TelemetryEvent) -> int:
         """Log a telemetry event and return the event ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect_for_write() as conn:
             cursor = conn.cursor()
             
             # Convert enum to string if needed
@@ -67,6 +75,43 @@ class SQLiteTelemetryRepository:
             conn.commit()
             return event_id
     
+    def log_events(self, events: List[TelemetryEvent]) -> None:
+        """Log several telemetry events with one prepared INSERT in a single transaction."""
+        if not events:
+            return
+        
+        # Gather columns first, then bind them row-wise through a single executemany
+        now = datetime.now()
+        timestamps = [event.timestamp or now for event in events]
+        event_types = [event.event_type.value if isinstance(event.event_type, EventType) else event.event_type
+                       for event in events]
+        messages = [event.message for event in events]
+        confidences = [event.confidence for event in events]
+        states = [event.state for event in events]
+        methods = [event.detection_method for event in events]
+        rect_xs = [event.match_rect_x for event in events]
+        rect_ys = [event.match_rect_y for event in events]
+        rect_widths = [event.match_rect_width for event in events]
+        rect_heights = [event.match_rect_height for event in events]
+        metadata = [json.dumps(event.metadata) if event.metadata else None for event in events]
+        
+        conn = self._connect_for_write()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("""
+                INSERT INTO telemetry_events 
+                (timestamp, event_type, message, confidence, state, detection_method,
+                 match_rect_x, match_rect_y, match_rect_width, match_rect_height, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, zip(timestamps, event_types, messages, confidences, states, methods,
+                     rect_xs, rect_ys, rect_widths, rect_heights, metadata))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
     def get_events(self, 
                   start_time: Optional[datetime] = None,
                   end_time: Optional[datetime] = None,
@@ -187,6 +232,33 @@ class SQLiteTelemetryRepository:
             
             return stats
     
+    def get_detection_counters(self, 
+                               start_time: Optional[datetime] = None,
+                               end_time: Optional[datetime] = None) -> SessionStats:
+        """Get only idle/failure counts and the last event time - one indexed pass, no averages."""
+        
+        if not start_time:
+            start_time = datetime.now() - timedelta(days=1)  # Default to last 24 hours
+        if not end_time:
+            end_time = datetime.now()
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    COALESCE(SUM(event_type = ?), 0),
+                    COALESCE(SUM(event_type = ?), 0),
+                    MAX(timestamp)
+                FROM telemetry_events 
+                WHERE timestamp BETWEEN ? AND ?
+            """, (EventType.IDLE_DETECTION.value, EventType.DETECTION_FAILURE.value, start_time, end_time))
+            
+            idle_count, failure_count, last_event = cursor.fetchone()
+            stats = SessionStats(total_idle_detections=idle_count, total_detection_failures=failure_count)
+            if last_event:
+                stats.last_event = datetime.fromisoformat(last_event)
+            return stats
+    
     def cleanup_old_data(self, days_to_keep: int = 30) -> int:
         """Clean up old data. Returns number of records removed."""
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
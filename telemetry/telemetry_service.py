@@ -7,7 +7,7 @@ Concrete implementation of TelemetryService using dependency injection.
 
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from .models import TelemetryEvent, SessionStats, EventType
 from .interfaces import TelemetryRepository
 
@@ -26,9 +26,29 @@ class DefaultTelemetryService:
                         match_rect: tuple = None,
                         metadata: Dict[str, Any] = None) -> None:
         """Record a detection event with specified type and optional parameters."""
+        self.repository.log_event(self._build_event(
+            event_type, message, confidence, detection_method, state, match_rect, metadata
+        ))
+    
+    def record_detections(self, records: List[Dict[str, Any]]) -> None:
+        """Record several detection events in one repository transaction.
         
+        Each record holds record_detection() keyword arguments plus an optional 'timestamp'.
+        """
+        self.repository.log_events([self._build_event(**record) for record in records])
+    
+    def _build_event(self,
+                     event_type: EventType,
+                     message: str = None,
+                     confidence: float = None,
+                     detection_method: str = None,
+                     state: str = None,
+                     match_rect: tuple = None,
+                     metadata: Dict[str, Any] = None,
+                     timestamp: datetime = None) -> TelemetryEvent:
+        """Create a TelemetryEvent from record_detection() arguments."""
         event = TelemetryEvent(
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             event_type=event_type,
             message=message,
             confidence=confidence,
@@ -44,7 +64,7 @@ class DefaultTelemetryService:
             event.match_rect_width = match_rect[2]
             event.match_rect_height = match_rect[3]
         
-        self.repository.log_event(event)
+        return event
     
     def record_event(self, 
                     event_type: EventType,
@@ -72,12 +92,18 @@ class DefaultTelemetryService:
             metadata=metadata if metadata else None
         )
     
-    def get_recent_stats(self, hours: int = 24) -> SessionStats:
-        """Get statistics for recent activity."""
+    def get_recent_stats(self, hours: int = 24, lightweight: bool = False) -> SessionStats:
+        """Get statistics for recent activity.
+        
+        With lightweight=True only idle detections, detection failures and the last event
+        time are filled in, from a single counting query.
+        """
         from datetime import timedelta
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
         
+        if lightweight:
+            return self.repository.get_detection_counters(start_time, end_time)
         return self.repository.get_session_stats(start_time, end_time)
     
     # Convenience methods for common event types
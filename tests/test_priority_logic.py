@@ -10,7 +10,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agent_monitor_poc import EnhancedTemplateMatchDetector, AgentState
+import collections
+
+from agent_monitor_poc import EnhancedTemplateMatchDetector, OCRDetector, AgentMonitor, AgentState, REQUIRED_CONFIRMATIONS
 
 class MockTemplateDetector(EnhancedTemplateMatchDetector):
     """Mock detector that allows us to inject confidence scores for testing."""
@@ -191,6 +193,100 @@ def test_run_command_with_multiple_states():
     
     return result == AgentState.RUN_COMMAND
 
+class FrameMockTemplateDetector(MockTemplateDetector):
+    """Mock template detector with the monitor's detect_state(frame) signature."""
+    
+    def detect_state(self, frame=None, digest=None):
+        return MockTemplateDetector.detect_state(self)
+
+class MockOCRDetector(OCRDetector):
+    """OCR detector that classifies canned text instead of capturing the screen."""
+    
+    def __init__(self, text):
+        self.text = text
+        self._recent_states = collections.deque(maxlen=REQUIRED_CONFIRMATIONS)
+    
+    def detect_state(self, frame=None, digest=None):
+        return self._confirm(self._classify_text(self.text))
+
+def run_monitor_detectors(detectors):
+    """Run AgentMonitor's detector dispatch without starting capture, telemetry or sound."""
+    monitor = AgentMonitor.__new__(AgentMonitor)
+    monitor.detectors = detectors
+    monitor._pool = None
+    return monitor._run_detectors(None)
+
+def test_ocr_does_not_override_unknown():
+    """Test OCR_001: OCR without a keyword keeps a template UNKNOWN"""
+    print("Test OCR_001: OCR without keyword keeps unknown")
+    
+    mock_confidences = {
+        'active': 0.83,
+        'idle': 0.81  # Gap too small - template detector is undecided
+    }
+    
+    template_detector = FrameMockTemplateDetector(mock_confidences)
+    ocr_detector = MockOCRDetector("Explain this function")
+    detector, result = run_monitor_detectors([template_detector, ocr_detector])
+    
+    print(f"  Confidences: {mock_confidences}")
+    print(f"  OCR text: {ocr_detector.text!r}")
+    print(f"  Expected: unknown")
+    print(f"  Actual: {result}")
+    print(f"  Result: {'✅ PASS' if result == AgentState.UNKNOWN else '❌ FAIL'}")
+    print()
+    
+    return result == AgentState.UNKNOWN
+
+def test_ocr_never_reports_idle():
+    """Test OCR_002: OCR text that also appears outside idle never yields IDLE"""
+    print("Test OCR_002: OCR never reports idle")
+    
+    mock_confidences = {
+        'active': 0.70,  # Below threshold
+        'idle': 0.65
+    }
+    
+    template_detector = FrameMockTemplateDetector(mock_confidences)
+    ocr_detector = MockOCRDetector("Accept Start a new chat")
+    results = [run_monitor_detectors([template_detector, ocr_detector])[1]
+               for _ in range(REQUIRED_CONFIRMATIONS + 1)]
+    
+    passed = all(result == AgentState.UNKNOWN for result in results)
+    print(f"  Confidences: {mock_confidences}")
+    print(f"  OCR text: {ocr_detector.text!r}")
+    print(f"  Expected: unknown on every tick")
+    print(f"  Actual: {results}")
+    print(f"  Result: {'✅ PASS' if passed else '❌ FAIL'}")
+    print()
+    
+    return passed
+
+def test_ocr_requires_confirmations():
+    """Test OCR_003: an OCR verdict only counts after REQUIRED_CONFIRMATIONS consistent reads"""
+    print("Test OCR_003: OCR verdict needs confirmations")
+    
+    mock_confidences = {
+        'active': 0.70,  # Below threshold
+        'idle': 0.65
+    }
+    
+    template_detector = FrameMockTemplateDetector(mock_confidences)
+    ocr_detector = MockOCRDetector("Generating")
+    results = [run_monitor_detectors([template_detector, ocr_detector])[1]
+               for _ in range(REQUIRED_CONFIRMATIONS)]
+    expected = [AgentState.UNKNOWN] * (REQUIRED_CONFIRMATIONS - 1) + [AgentState.ACTIVE]
+    
+    passed = results == expected
+    print(f"  Confidences: {mock_confidences}")
+    print(f"  OCR text: {ocr_detector.text!r}")
+    print(f"  Expected: {expected}")
+    print(f"  Actual: {results}")
+    print(f"  Result: {'✅ PASS' if passed else '❌ FAIL'}")
+    print()
+    
+    return passed
+
 def main():
     """Run all priority logic tests."""
     print("=" * 60)
@@ -203,7 +299,10 @@ def main():
         test_run_command_over_idle,
         test_highest_confidence_no_run_command,
         test_unknown_when_gap_too_small,
-        test_run_command_with_multiple_states
+        test_run_command_with_multiple_states,
+        test_ocr_does_not_override_unknown,
+        test_ocr_never_reports_idle,
+        test_ocr_requires_confirmations
     ]
     
     passed = 0
@@ -5,13 +5,15 @@ Test script for the new telemetry system
 
 import sys
 import os
-from datetime import datetime
+import tempfile
+import uuid
+from datetime import datetime, timedelta
 
 # Add parent directory to path to import from project modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from container import TelemetryContainer, initialize_telemetry_system
-from telemetry import EventType
+from telemetry import EventType, SQLiteTelemetryRepository, DefaultTelemetryService
 
 def test_basic_functionality():
     """Test basic telemetry functionality."""
@@ -66,7 +68,34 @@ def test_basic_functionality():
             execution_time=0.5
         )
         
+        # Batched recording - written in a single transaction
+        batch_tag = uuid.uuid4().hex
+        batch_start = datetime.now() - timedelta(hours=2)
+        explicit_timestamp = datetime.now() - timedelta(hours=1)
+        counters_before = repository.get_detection_counters(batch_start, datetime.now() + timedelta(minutes=1))
+        
+        telemetry_service.record_detections([
+            {"event_type": EventType.IDLE_DETECTION, "message": f"Test batched idle detection {batch_tag}",
+             "confidence": 0.91, "state": "idle", "match_rect": (10, 20, 30, 40)},
+            {"event_type": EventType.DETECTION_FAILURE, "message": f"Test batched failure {batch_tag}",
+             "state": "unknown", "timestamp": explicit_timestamp}
+        ])
+        
+        batched = {event.event_type: event for event in repository.get_events(start_time=batch_start)
+                   if event.message and batch_tag in event.message}
+        assert len(batched) == 2, f"expected 2 batched events, found {len(batched)}"
+        idle_event = batched[EventType.IDLE_DETECTION]
+        assert idle_event.confidence == 0.91, f"confidence not persisted: {idle_event.confidence}"
+        assert (idle_event.match_rect_x, idle_event.match_rect_y,
+                idle_event.match_rect_width, idle_event.match_rect_height) == (10, 20, 30, 40), "match_rect not persisted"
+        assert batched[EventType.DETECTION_FAILURE].timestamp == explicit_timestamp, "explicit timestamp not honoured"
+        
+        counters_after = repository.get_detection_counters(batch_start, datetime.now() + timedelta(minutes=1))
+        assert counters_after.total_idle_detections == counters_before.total_idle_detections + 1, "idle count not updated"
+        assert counters_after.total_detection_failures == counters_before.total_detection_failures + 1, "failure count not updated"
+        
         print("   ✓ Test events recorded successfully")
+        print("   ✓ Batched events persisted with confidence, match rect and timestamp")
         
         # Test retrieving events
         print("5. Testing event retrieval...")
@@ -111,6 +140,39 @@ def test_basic_functionality():
         traceback.print_exc()
         return False
 
+def test_adapter_close_flushes_all_batches():
+    """Test that LegacyTelemetryAdapter.close() writes every queued event, across several batches."""
+    print("\nTesting telemetry writer flush on close...")
+    print("=" * 50)
+    
+    try:
+        from agent_monitor_poc import LegacyTelemetryAdapter, TELEMETRY_BATCH_SIZE
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repository = SQLiteTelemetryRepository(db_path=os.path.join(tmp_dir, "telemetry.db"))
+            repository.initialize()
+            adapter = LegacyTelemetryAdapter(DefaultTelemetryService(repository))
+            
+            event_count = TELEMETRY_BATCH_SIZE * 2 + 5
+            for i in range(event_count):
+                adapter.log_event(f"Queued event {i}")
+            adapter.close()
+            
+            assert not adapter._writer_thread.is_alive(), "writer thread still running after close()"
+            events = repository.get_events()
+            assert len(events) == event_count, f"expected {event_count} events, found {len(events)}"
+            print(f"   ✓ {event_count} events flushed ({TELEMETRY_BATCH_SIZE} per batch)")
+        
+        print("✅ Telemetry writer flushed all batches on close.")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 if __name__ == "__main__":
     success = test_basic_functionality()
+    success = test_adapter_close_flushes_all_batches() and success
     sys.exit(0 if success else 1) 
\ No newline at end of file